@@ -3,7 +3,7 @@ FastAPI application setup for Mini-N8N.
 Initializes database, registers node types, and configures API with secure CORS + API Key authentication.
 """
 
-from fastapi import FastAPI, Header, HTTPException, Depends
+from fastapi import FastAPI, Header, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
@@ -11,7 +11,9 @@ import logging
 import os
 
 from storage.database import init_database
+from utils.http_client import close_http_client
 from nodes.registry_setup import register_all_nodes
+from nodes.video_node import notify_replicate_prediction
 from api.routes import router  # IMPORTANT: include all API endpoints
 
 
@@ -74,6 +76,9 @@ async def lifespan(app: FastAPI):
     yield
     logging.info("Mini-N8N shutting down...")
 
+    # Release pooled outbound connections
+    await close_http_client()
+
 
 # ---------------------------------------------------------------------
 # FastAPI Instance Creation
@@ -113,6 +118,25 @@ async def health_check():
     return {"status": "healthy", "service": "mini-n8n"}
 
 
+# ---------------------------------------------------------------------
+# Replicate Webhook (Public)
+# ---------------------------------------------------------------------
+@app.post("/internal/replicate-callback")
+async def replicate_callback(request: Request):
+    """
+    Completion webhook for Replicate predictions (REPLICATE_WEBHOOK_URL).
+
+    Only wakes the waiting node, which then re-fetches the prediction from
+    Replicate, so the payload itself is never trusted.
+    """
+    payload = await request.json()
+    prediction_id = payload.get("id") if isinstance(payload, dict) else None
+    if not prediction_id:
+        raise HTTPException(status_code=400, detail="Missing prediction id")
+
+    return {"received": notify_replicate_prediction(prediction_id)}
+
+
 # ---------------------------------------------------------------------
 # Root Endpoint (Public)
 # ---------------------------------------------------------------------
@@ -69,7 +69,7 @@ async def create_workflow(request: CreateWorkflowRequest):
             raise HTTPException(status_code=400, detail=errors)
 
         db = get_database()
-        saved = await db.create_workflow(workflow.to_dict())
+        saved = await db.create_workflow(WorkflowSerializer.to_dict(workflow))
 
         return saved.data
 
@@ -91,10 +91,10 @@ async def get_workflow(workflow_id: str):
 @router.get("/workflows/")
 async def list_workflows(limit: int = 100, offset: int = 0):
     db = get_database()
-    items = await db.list_workflows(limit=limit, offset=offset)
+    items = await db.list_workflows_lite(limit=limit, offset=offset)
 
     return {
-        "workflows": [i.data for i in items],
+        "workflows": items,
         "total": len(items)
     }
 
@@ -127,9 +127,11 @@ async def update_workflow(workflow_id: str, request: UpdateWorkflowRequest):
     if errors:
         raise HTTPException(status_code=400, detail=errors)
 
-    updated = await db.update_workflow(workflow_id, workflow.to_dict())
+    workflow_data = WorkflowSerializer.to_dict(workflow)
+    if not await db.update_workflow(workflow_id, workflow_data):
+        raise HTTPException(status_code=404, detail="Workflow not found")
 
-    return updated.data
+    return workflow_data
 
 
 @router.delete("/workflows/{workflow_id}")
@@ -190,7 +192,7 @@ async def execute_workflow(
 async def _background_execute(workflow, execution_id, input_data, use_cache):
     db = get_database()
 
-    await db.update_execution(
+    await db.update_execution_async(
         execution_id,
         status=ExecutionStatus.RUNNING,
         started_at=datetime.utcnow()
@@ -201,20 +203,23 @@ async def _background_execute(workflow, execution_id, input_data, use_cache):
     try:
         result = await runner.run(input_data=input_data)
 
-        await db.update_execution(
+        await db.append_node_results(execution_id, result.node_results)
+
+        await db.update_execution_async(
             execution_id,
+            flush=True,
             status=ExecutionStatus.SUCCESS,
             output_data=result.output,
             error=result.error,
-            node_results=result.node_results,
             execution_order=result.execution_order,
             finished_at=result.finished_at,
             execution_time=result.execution_time
         )
 
     except Exception as e:
-        await db.update_execution(
+        await db.update_execution_async(
             execution_id,
+            flush=True,
             status=ExecutionStatus.FAILED,
             error=str(e),
             finished_at=datetime.utcnow()
@@ -224,7 +229,7 @@ async def _background_execute(workflow, execution_id, input_data, use_cache):
 @router.get("/workflows/{workflow_id}/executions/{execution_id}")
 async def get_execution(workflow_id: str, execution_id: str):
     db = get_database()
-    execution = await db.get_execution(execution_id)
+    execution = await db.get_execution_full(execution_id)
 
     if not execution:
         raise HTTPException(status_code=404, detail="Execution not found")
@@ -235,10 +240,10 @@ async def get_execution(workflow_id: str, execution_id: str):
 @router.get("/workflows/{workflow_id}/executions/")
 async def list_executions(workflow_id: str, limit: int = 100, offset: int = 0):
     db = get_database()
-    items = await db.list_executions(workflow_id, limit, offset)
+    items = await db.list_executions_lite(workflow_id, limit, offset)
 
     return {
-        "executions": [i.to_dict() for i in items],
+        "executions": items,
         "total": len(items)
     }
 
@@ -24,7 +24,7 @@ import logging
 from core.dag import DAG, TopologicalSorter, CycleDetectedError, DAGValidationError
 from core.registry import registry, NodeTypeInfo
 from . import registry as _unused_registry_import  # ensures package resolution in some setups
-from nodes.base import NodeResult, BaseNode  # type: ignore
+from nodes.base import NodeResult, BaseNode, collect_stream  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -355,6 +355,10 @@ class WorkflowRunner:
                 # wrap into NodeResult (best-effort)
                 result = NodeResult(success=True, output=result, error=None, execution_time=0.0, metadata={"node_id": node_id})
 
+            # Downstream nodes read materialized outputs, so drain any stream here
+            if result.stream is not None:
+                await collect_stream(result)
+
         except Exception as e:
             logger.exception(f"Exception while running node {node_id}: {e}")
             result = NodeResult(success=False, output=None, error=str(e), execution_time=0.0, metadata={"node_id": node_id})
@@ -15,7 +15,7 @@ import uuid
 from core.workflow import Workflow
 from core.dag import DAG, TopologicalSorter, CycleDetectedError
 from core.registry import registry
-from nodes.base import NodeResult
+from nodes.base import NodeResult, collect_stream
 from .cache import ExecutionCache
 
 logger = logging.getLogger(__name__)
@@ -223,6 +223,8 @@ class WorkflowExecutor:
             # Execute
             start = time.time()
             result: NodeResult = await instance.run(node_inputs, context.variables)
+            if result.stream is not None:
+                await collect_stream(result)
             result.execution_time = time.time() - start
 
             # Save to cache
@@ -8,7 +8,7 @@ This ensures that whenever `nodes` is imported, all node types become available
 for workflow creation and execution.
 """
 
-from .base import BaseNode, NodeResult, NodeExecutionError
+from .base import BaseNode, NodeResult, NodeExecutionError, collect_stream
 from .registry_setup import register_all_nodes
 
 # Import node classes for explicit export
@@ -25,6 +25,7 @@ __all__ = [
     "BaseNode",
     "NodeResult",
     "NodeExecutionError",
+    "collect_stream",
 
     # Node Implementations
     "UserInputNode",
@@ -10,13 +10,15 @@ Includes:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, AsyncIterator
 from dataclasses import dataclass
 from datetime import datetime
 import logging
 import time
 import inspect
 
+from utils.template import warm_templates
+
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +28,7 @@ class NodeExecutionError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeResult:
     """Result of node execution."""
     success: bool
@@ -34,28 +36,68 @@ class NodeResult:
     error: Optional[str] = None
     execution_time: float = 0.0
     metadata: Dict[str, Any] = None
+    # Optional chunk stream (e.g. LLM tokens); the node fills `output` once drained
+    stream: Optional[AsyncIterator[str]] = None
 
     def __post_init__(self):
         if self.metadata is None:
             self.metadata = {}
 
 
+async def collect_stream(result: NodeResult) -> NodeResult:
+    """
+    Drain a streaming NodeResult for consumers that need the final output.
+    A failure while streaming marks the result as failed.
+    """
+    if result.stream is None:
+        return result
+
+    stream, result.stream = result.stream, None
+    start_time = time.time()
+    try:
+        async for _ in stream:
+            pass
+    except Exception as e:
+        result.success = False
+        result.error = str(e)
+    result.execution_time += time.time() - start_time
+    return result
+
+
 class BaseNode(ABC):
     """Base class for all workflow nodes."""
 
+    # Whether the lifecycle hooks are coroutines (resolved per subclass)
+    _before_run_is_async: bool = False
+    _after_run_is_async: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._before_run_is_async = inspect.iscoroutinefunction(cls.before_run)
+        cls._after_run_is_async = inspect.iscoroutinefunction(cls.after_run)
+
     def __init__(self, node_id: str, config: Dict[str, Any]):
         self.node_id = node_id
         self.config = config or {}
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.cfg = self._build_config(self.config)
+        # Compile config templates now rather than on the first run
+        warm_templates(self.config)
+
+    def _build_config(self, config: Dict[str, Any]) -> Any:
+        """Materialize a typed config object once; nodes override to opt in."""
+        return None
 
     # ----------------------------------------
     # Lifecycle Hooks
     # ----------------------------------------
-    async def before_run(self, inputs: Dict[str, Any], context: Dict[str, Any]):
+    # Default hooks are synchronous so execute() does not pay for an await
+    # when they are not overridden; subclasses may override them as coroutines.
+    def before_run(self, inputs: Dict[str, Any], context: Dict[str, Any]):
         """Hook before executing the node."""
         self.log_info("Starting execution.", inputs=inputs)
 
-    async def after_run(self, result: NodeResult):
+    def after_run(self, result: NodeResult):
         """Hook after executing the node."""
         self.log_info(
             "Execution finished.",
@@ -74,7 +116,10 @@ class BaseNode(ABC):
         - metadata enrichment
         """
 
-        await self.before_run(inputs, context)
+        if self._before_run_is_async:
+            await self.before_run(inputs, context)
+        else:
+            self.before_run(inputs, context)
 
         start_time = time.time()
         try:
@@ -86,19 +131,26 @@ class BaseNode(ABC):
 
             execution_time = time.time() - start_time
 
-            result = NodeResult(
-                success=True,
-                output=output,
-                execution_time=execution_time,
-                metadata={
-                    "node_id": self.node_id,
-                    "node_type": self.__class__.__name__,
-                }
-            )
+            if isinstance(output, NodeResult):
+                # run() built its own result via create_result()
+                result = output
+                result.execution_time = execution_time
+                result.metadata.setdefault("node_id", self.node_id)
+                result.metadata.setdefault("node_type", self.__class__.__name__)
+            else:
+                result = NodeResult(
+                    success=True,
+                    output=output,
+                    execution_time=execution_time,
+                    metadata={
+                        "node_id": self.node_id,
+                        "node_type": self.__class__.__name__,
+                    }
+                )
 
         except Exception as e:
             execution_time = time.time() - start_time
-            self.log_error(f"Execution failed: {str(e)}")
+            self.log_error("Execution failed: %s", e)
 
             result = NodeResult(
                 success=False,
@@ -111,7 +163,10 @@ class BaseNode(ABC):
                 }
             )
 
-        await self.after_run(result)
+        if self._after_run_is_async:
+            await self.after_run(result)
+        else:
+            self.after_run(result)
         return result
 
     # ----------------------------------------
@@ -121,6 +176,8 @@ class BaseNode(ABC):
     async def run(self, inputs: Dict[str, Any], context: Dict[str, Any]) -> Any:
         pass
 
+    # Schemas are static per class; subclasses memoize them with
+    # functools.lru_cache so registration and validation reuse one dict.
     @classmethod
     @abstractmethod
     def get_input_schema(cls) -> Dict[str, Any]:
@@ -156,11 +213,41 @@ class BaseNode(ABC):
     def get_config_value(self, key: str, default: Any = None):
         return self.config.get(key, default)
 
-    def log_info(self, message: str, **kwargs):
-        self.logger.info(f"[{self.node_id}] {message} | {kwargs}")
-
-    def log_error(self, message: str, **kwargs):
-        self.logger.error(f"[{self.node_id}] {message} | {kwargs}")
+    def create_result(
+        self,
+        output: Any,
+        success: bool = True,
+        error: Optional[str] = None,
+        stream: Optional[AsyncIterator[str]] = None,
+        **metadata
+    ) -> NodeResult:
+        """Build a NodeResult from run(); extra kwargs become metadata."""
+        return NodeResult(
+            success=success,
+            output=output,
+            error=error,
+            metadata=metadata,
+            stream=stream,
+        )
 
-    def log_warning(self, message: str, **kwargs):
-        self.logger.warning(f"[{self.node_id}] {message} | {kwargs}")
+    # Formatting is deferred to the logging framework and skipped entirely
+    # when the level is disabled; node_id is also attached as a structured field.
+    # Extra positional args fill %-style placeholders in the message.
+    def _log(self, level: int, message: str, args: tuple, kwargs: Dict[str, Any]):
+        if not self.logger.isEnabledFor(level):
+            return
+        if args:
+            self.logger.log(level, "[%s] " + message + " | %s", self.node_id, *args, kwargs,
+                            extra={"node_id": self.node_id})
+        else:
+            self.logger.log(level, "[%s] %s | %s", self.node_id, message, kwargs,
+                            extra={"node_id": self.node_id})
+
+    def log_info(self, message: str, *args, **kwargs):
+        self._log(logging.INFO, message, args, kwargs)
+
+    def log_error(self, message: str, *args, **kwargs):
+        self._log(logging.ERROR, message, args, kwargs)
+
+    def log_warning(self, message: str, *args, **kwargs):
+        self._log(logging.WARNING, message, args, kwargs)
@@ -2,11 +2,29 @@
 Conditional Logic Node - Advanced IF/ELSE branching (Opal-grade)
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+import functools
 from .base import BaseNode
-from utils.template import interpolate_variables
+from utils.template import prepare_template, render_prepared
+import operator
 import json
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; batch comparisons fall back to Python
+    np = None
+
+
+# Comparisons that can be applied elementwise to equal-length numeric arrays
+_BATCH_OPS = {
+    "equals": operator.eq,
+    "not_equals": operator.ne,
+    "greater_than": operator.gt,
+    "less_than": operator.lt,
+    "greater_or_equal": operator.ge,
+    "less_or_equal": operator.le,
+}
+
 
 class ConditionalLogicNode(BaseNode):
     """
@@ -20,9 +38,23 @@ class ConditionalLogicNode(BaseNode):
     - is_empty / is_not_empty
     """
 
+    def __init__(self, node_id: str, config: Dict[str, Any]):
+        super().__init__(node_id, config)
+
+        # Pre-resolve condition operands that contain no placeholders
+        conditions = self.get_config_value("conditions", []) or []
+        self._conditions = [
+            (
+                cond,
+                prepare_template(str(cond.get("value1", ""))),
+                prepare_template(str(cond.get("value2", ""))),
+            )
+            for cond in conditions
+            if isinstance(cond, dict)
+        ]
+
     async def run(self, inputs: Dict[str, Any], context: Dict[str, Any]):
         try:
-            conditions: List[Dict[str, Any]] = self.get_config_value("conditions", [])
             logic_mode = self.get_config_value("logic_mode", "AND").upper()
 
             evaluated_conditions = []
@@ -31,23 +63,37 @@ class ConditionalLogicNode(BaseNode):
             # -----------------------------------------------------
             # 1) Evaluate each condition
             # -----------------------------------------------------
-            for cond in conditions:
-                value1_raw = interpolate_variables(str(cond.get("value1", "")), context, inputs)
-                value2_raw = interpolate_variables(str(cond.get("value2", "")), context, inputs)
+            for cond, value1_tpl, value2_tpl in self._conditions:
+                value1_raw = render_prepared(value1_tpl, context, inputs)
+                value2_raw = render_prepared(value2_tpl, context, inputs)
 
                 value1 = self._parse_value(value1_raw)
                 value2 = self._parse_value(value2_raw)
 
                 condition_type = cond.get("condition_type", "equals")
 
-                passed = self._evaluate_condition(condition_type, value1, value2)
-
-                evaluated_conditions.append({
+                evaluated = {
                     "value1": value1,
                     "value2": value2,
                     "condition_type": condition_type,
-                    "result": passed
-                })
+                }
+
+                batch = self._evaluate_batch(condition_type, value1, value2)
+                if batch is not None:
+                    # Array inputs: not_equals holds if any element differs
+                    # (like list !=); every other operator must hold for all
+                    true_indices, false_indices = batch
+                    if condition_type == "not_equals":
+                        passed = bool(true_indices)
+                    else:
+                        passed = not false_indices
+                    evaluated["true_indices"] = true_indices
+                    evaluated["false_indices"] = false_indices
+                else:
+                    passed = self._evaluate_condition(condition_type, value1, value2)
+
+                evaluated["result"] = passed
+                evaluated_conditions.append(evaluated)
 
                 results.append(passed)
 
@@ -63,7 +109,7 @@ class ConditionalLogicNode(BaseNode):
 
             branch = "true" if final_result else "false"
 
-            self.log_info(f"Conditional result: {final_result} → branch '{branch}'")
+            self.log_info("Conditional result: %s → branch '%s'", final_result, branch)
 
             return self.create_result(
                 output={
@@ -77,7 +123,7 @@ class ConditionalLogicNode(BaseNode):
             )
 
         except Exception as e:
-            self.log_error(f"ConditionalNode error: {e}")
+            self.log_error("ConditionalNode error: %s", e)
             return self.create_result(None, success=False, error=str(e))
 
     # =====================================================================
@@ -86,6 +132,10 @@ class ConditionalLogicNode(BaseNode):
     def _parse_value(self, value_raw: str):
         """Convert strings into booleans, numbers, JSON, or keep as string."""
 
+        # Already typed (e.g. interpolation resolved to a list/number)
+        if not isinstance(value_raw, str):
+            return value_raw
+
         # Boolean
         if value_raw.lower() == "true":
             return True
@@ -157,9 +207,32 @@ class ConditionalLogicNode(BaseNode):
             raise ValueError(f"Unknown condition type: {condition_type}")
 
         except Exception as e:
-            self.log_warning(f"Condition evaluation failed: {e}")
+            self.log_warning("Condition evaluation failed: %s", e)
             return False
 
+    def _evaluate_batch(
+        self, condition_type: str, value1: Any, value2: Any
+    ) -> Optional[Tuple[List[int], List[int]]]:
+        """Elementwise comparison of two equal-length numeric lists.
+
+        Returns (true_indices, false_indices), or None when the inputs are not
+        numeric arrays and the scalar path should be used instead.
+        """
+        op = _BATCH_OPS.get(condition_type)
+        if op is None or not (_is_numeric_list(value1) and _is_numeric_list(value2)):
+            return None
+        if len(value1) != len(value2):
+            return None
+
+        if np is not None:
+            mask = op(np.asarray(value1), np.asarray(value2))
+            return np.flatnonzero(mask).tolist(), np.flatnonzero(~mask).tolist()
+
+        true_indices, false_indices = [], []
+        for i, (a, b) in enumerate(zip(value1, value2)):
+            (true_indices if op(a, b) else false_indices).append(i)
+        return true_indices, false_indices
+
     def _safe_compare(self, a, b, op):
         """Prevent type errors when comparing numbers/strings."""
         try:
@@ -174,6 +247,7 @@ class ConditionalLogicNode(BaseNode):
     # SCHEMAS
     # =====================================================================
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_input_schema(cls):
         return {
             "type": "object",
@@ -184,6 +258,7 @@ class ConditionalLogicNode(BaseNode):
         }
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_output_schema(cls):
         return {
             "type": "object",
@@ -197,6 +272,7 @@ class ConditionalLogicNode(BaseNode):
         }
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_config_schema(cls):
         return {
             "type": "object",
@@ -240,3 +316,12 @@ class ConditionalLogicNode(BaseNode):
             },
             "required": ["conditions"]
         }
+
+
+def _is_numeric_list(value: Any) -> bool:
+    """True for a non-empty list containing only ints/floats (bools excluded)."""
+    return (
+        isinstance(value, list)
+        and len(value) > 0
+        and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value)
+    )
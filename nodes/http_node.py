@@ -3,10 +3,13 @@ HTTPRequest Node - Reliable, template-aware, retry-capable, Opal-grade HTTP node
 """
 
 from typing import Dict, Any, Optional
+import functools
 import httpx
+import asyncio
 import time
 from .base import BaseNode
-from utils.template import interpolate_variables
+from utils.template import prepare_template, render_prepared
+from utils.http_client import get_node_http_client
 
 
 SAFE_HEADER_PREFIXES = ["authorization", "api-key", "x-api-key", "proxy-authorization"]
@@ -21,12 +24,27 @@ class HTTPRequestNode(BaseNode):
     - metadata output
     """
 
+    def __init__(self, node_id: str, config: Dict[str, Any]):
+        super().__init__(node_id, config)
+
+        # Templates without placeholders are resolved once here, not per run
+        self._url = prepare_template(self.get_config_value("url", ""))
+        self._headers = {
+            k: prepare_template(v) if isinstance(v, str) else (True, v)
+            for k, v in (self.get_config_value("headers", {}) or {}).items()
+        }
+
+        body_cfg = self.get_config_value("body", None)
+        if isinstance(body_cfg, dict):
+            self._body = {key: prepare_template(str(val)) for key, val in body_cfg.items()}
+        elif isinstance(body_cfg, str):
+            self._body = prepare_template(body_cfg)
+        else:
+            self._body = None
+
     async def run(self, inputs: Dict[str, Any], context: Dict[str, Any]):
         try:
             method = self.get_config_value("method", "GET").upper()
-            url_template = self.get_config_value("url", "")
-            headers_cfg = self.get_config_value("headers", {})
-            body_cfg = self.get_config_value("body", None)
             timeout = self.get_config_value("timeout", 30)
             retries = self.get_config_value("retries", 1)
             retry_delay = self.get_config_value("retry_delay", 1.5)
@@ -35,17 +53,15 @@ class HTTPRequestNode(BaseNode):
             # ----------------------------------------
             # 1) Interpolate URL
             # ----------------------------------------
-            url = interpolate_variables(url_template, context, inputs)
+            url = render_prepared(self._url, context, inputs)
 
             # ----------------------------------------
             # 2) Build headers with interpolation
             # ----------------------------------------
-            headers = {}
-            for k, v in headers_cfg.items():
-                if isinstance(v, str):
-                    headers[k] = interpolate_variables(v, context, inputs)
-                else:
-                    headers[k] = v  # fallback raw
+            headers = {
+                k: render_prepared(v, context, inputs)
+                for k, v in self._headers.items()
+            }
 
             # ----------------------------------------
             # 3) Build body (supports raw, dict, templated string)
@@ -54,14 +70,14 @@ class HTTPRequestNode(BaseNode):
             data_body = None
             raw_body = None
 
-            if isinstance(body_cfg, dict):
+            if isinstance(self._body, dict):
                 # Template each value inside dict
                 json_body = {
-                    key: interpolate_variables(str(val), context, inputs)
-                    for key, val in body_cfg.items()
+                    key: render_prepared(val, context, inputs)
+                    for key, val in self._body.items()
                 }
-            elif isinstance(body_cfg, str):
-                raw_body = interpolate_variables(body_cfg, context, inputs)
+            elif self._body is not None:
+                raw_body = render_prepared(self._body, context, inputs)
             else:
                 json_body = None
 
@@ -71,26 +87,29 @@ class HTTPRequestNode(BaseNode):
             response = None
             error = None
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                for attempt in range(retries + 1):
-                    try:
-                        start = time.time()
-                        response = await client.request(
-                            method=method,
-                            url=url,
-                            headers=headers,
-                            json=json_body,
-                            content=raw_body,
-                        )
-                        duration = time.time() - start
-                        break  # success -> stop retrying
-
-                    except httpx.RequestError as e:
-                        error = str(e)
-                        if attempt < retries:
-                            await asyncio.sleep(retry_delay)
-                        else:
-                            raise
+            # Pooled client: keep-alive connections are reused across runs,
+            # cookies from responses are not
+            client = get_node_http_client()
+            for attempt in range(retries + 1):
+                try:
+                    start = time.time()
+                    response = await client.request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        json=json_body,
+                        content=raw_body,
+                        timeout=timeout,
+                    )
+                    duration = time.time() - start
+                    break  # success -> stop retrying
+
+                except httpx.RequestError as e:
+                    error = str(e)
+                    if attempt < retries:
+                        await asyncio.sleep(retry_delay)
+                    else:
+                        raise
 
             # ----------------------------------------
             # 5) Parse response
@@ -120,14 +139,18 @@ class HTTPRequestNode(BaseNode):
                 "url": str(response.url),
                 "request_method": method,
                 "request_headers": safe_headers,
-                "response_headers": dict(response.headers),
-                "raw_text": response.text,
             }
 
+            # Copies of the full header set / body text are opt-in
+            if self.get_config_value("include_response_headers", False):
+                output["response_headers"] = dict(response.headers)
+            if self.get_config_value("include_raw_text", False):
+                output["raw_text"] = response.text
+
             return self.create_result(output, success=success)
 
         except Exception as e:
-            self.log_error(f"HTTP Request failed: {e}")
+            self.log_error("HTTP Request failed: %s", e)
             return self.create_result(None, success=False, error=str(e))
 
     # =========================================================================
@@ -156,6 +179,7 @@ class HTTPRequestNode(BaseNode):
     # SCHEMAS
     # =========================================================================
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_input_schema(cls):
         return {
             "type": "object",
@@ -166,6 +190,7 @@ class HTTPRequestNode(BaseNode):
         }
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_output_schema(cls):
         return {
             "type": "object",
@@ -183,6 +208,7 @@ class HTTPRequestNode(BaseNode):
         }
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_config_schema(cls):
         return {
             "type": "object",
@@ -202,6 +228,16 @@ class HTTPRequestNode(BaseNode):
                     "type": "string",
                     "enum": ["auto", "json", "text", "bytes"],
                     "default": "auto"
+                },
+                "include_response_headers": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Include response headers in the output"
+                },
+                "include_raw_text": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Include the raw response body text in the output"
                 }
             },
             "required": ["url"]
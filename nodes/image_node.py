@@ -3,11 +3,29 @@ Image Generation Node - OpenAI DALL·E / Replicate SDXL / Future: Google Imagen
 """
 
 from typing import Dict, Any
+import functools
 import os
 from .base import BaseNode
 from utils.template import interpolate_variables
+from utils.http_client import get_http_client
 import asyncio
 
+# Provider SDKs are optional; import once at load time instead of per call
+try:
+    from openai import AsyncOpenAI
+except ImportError:
+    AsyncOpenAI = None
+
+try:
+    import replicate
+except ImportError:
+    replicate = None
+
+try:
+    from google import genai
+except ImportError:
+    genai = None
+
 
 class ImageGenerationNode(BaseNode):
     """Generate images using multiple providers."""
@@ -26,7 +44,7 @@ class ImageGenerationNode(BaseNode):
             # Auto-detect provider if missing
             provider = provider or self._detect_provider(model)
 
-            self.log_info(f"[ImageNode] Provider={provider}, Model={model}, Size={size}")
+            self.log_info("[ImageNode] Provider=%s, Model=%s, Size=%s", provider, model, size)
 
             # Route to provider
             if provider == "openai":
@@ -59,7 +77,7 @@ class ImageGenerationNode(BaseNode):
             return self.create_result(output, success=True)
 
         except Exception as e:
-            self.log_error(f"Image generation failed: {e}")
+            self.log_error("Image generation failed: %s", e)
             return self.create_result(None, success=False, error=str(e))
 
     # =========================================================================
@@ -69,12 +87,14 @@ class ImageGenerationNode(BaseNode):
     async def _generate_openai(self, prompt, model, size, quality):
         """Generate using OpenAI DALL·E."""
         try:
-            from openai import AsyncOpenAI
+            if AsyncOpenAI is None:
+                raise RuntimeError("openai package not installed")
+
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY not set")
 
-            client = AsyncOpenAI(api_key=api_key)
+            client = _get_openai_client(api_key)
 
             response = await client.images.generate(
                 model=model,
@@ -96,7 +116,8 @@ class ImageGenerationNode(BaseNode):
     async def _generate_replicate(self, prompt, model):
         """Generate using Replicate SDXL/Flux/etc."""
         try:
-            import replicate
+            if replicate is None:
+                raise RuntimeError("replicate package not installed")
 
             api_key = os.getenv("REPLICATE_API_TOKEN")
             if not api_key:
@@ -127,7 +148,8 @@ class ImageGenerationNode(BaseNode):
 
     async def _generate_google(self, prompt, model, size):
         """Future support for Google Imagen/Gemini image models."""
-        from google import genai
+        if genai is None:
+            raise RuntimeError("google-genai package not installed")
 
         api_key = os.getenv("GOOGLE_API_KEY")
         if not api_key:
@@ -190,6 +212,7 @@ class ImageGenerationNode(BaseNode):
     # =========================================================================
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_input_schema(cls):
         return {
             "type": "object",
@@ -199,6 +222,7 @@ class ImageGenerationNode(BaseNode):
         }
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_output_schema(cls):
         return {
             "type": "object",
@@ -214,6 +238,7 @@ class ImageGenerationNode(BaseNode):
         }
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_config_schema(cls):
         return {
             "type": "object",
@@ -245,3 +270,17 @@ class ImageGenerationNode(BaseNode):
             },
             "required": ["prompt"]
         }
+
+
+def _get_openai_client(api_key: str):
+    """Return the AsyncOpenAI client for an API key, on the shared HTTP pool.
+
+    Keyed on the pooled client too (as in llm_node): after close_http_client()
+    a new pool is created, and clients bound to the closed one are not reused.
+    """
+    return _build_openai_client(api_key, get_http_client())
+
+
+@functools.lru_cache(maxsize=16)
+def _build_openai_client(api_key: str, http_client):
+    return AsyncOpenAI(api_key=api_key, http_client=http_client)
@@ -4,9 +4,83 @@ and metadata similar to Google Opal input nodes.
 """
 
 from typing import Dict, Any, Optional
+from dataclasses import dataclass, fields
+import functools
 from .base import BaseNode, NodeResult
 
 
+_TEXT, _NUMBER, _BOOL, _JSON = "text", "number", "boolean", "json"
+
+_BOOL_MAP = {
+    "true": True, "1": True, "yes": True,
+    "false": False, "0": False, "no": False,
+}
+
+
+# ----------------------------------------
+# Casters (one per expected type)
+# ----------------------------------------
+def _cast_text(value: Any):
+    return str(value).strip()
+
+
+def _cast_number(value: Any):
+    if isinstance(value, bool):
+        return int(value)  # True -> 1, False -> 0, as int() always did
+    if isinstance(value, (int, float)):
+        return value
+
+    s = value if isinstance(value, str) else str(value)
+    try:
+        return int(s)
+    except ValueError:
+        try:
+            return float(s)
+        except ValueError:
+            raise ValueError(f"Expected number but got '{value}'")
+
+
+def _cast_boolean(value: Any):
+    result = _BOOL_MAP.get(str(value).lower())
+    if result is None:
+        raise ValueError(f"Invalid boolean value: {value}")
+    return result
+
+
+def _cast_json(value: Any):
+    if isinstance(value, (dict, list)):
+        return value
+    raise ValueError("Expected JSON object/array")
+
+
+def _cast_many(values, expected_type: str) -> list:
+    """Cast a batch of values with one caster lookup for the whole list."""
+    if expected_type == _NUMBER and all(type(v) in (int, float) for v in values):
+        return list(values)
+
+    caster = _CASTERS.get(expected_type)
+    return list(map(caster, values)) if caster is not None else list(values)
+
+
+@dataclass(slots=True, frozen=True)
+class UserInputConfig:
+    """Typed view of the UserInputNode config, built once per node."""
+    input_key: str = "value"
+    required: bool = True
+    type: str = _TEXT
+
+
+_CONFIG_KEYS = frozenset(f.name for f in fields(UserInputConfig))
+
+
+_CASTERS = {
+    _TEXT: _cast_text,
+    _NUMBER: _cast_number,
+    _BOOL: _cast_boolean,
+    _JSON: _cast_json,
+}
+
+
 class UserInputNode(BaseNode):
     """
     Node for capturing and validating user input.
@@ -18,14 +92,18 @@ class UserInputNode(BaseNode):
     - auto-casting
     """
 
+    def _build_config(self, config: Dict[str, Any]) -> UserInputConfig:
+        return UserInputConfig(**{k: v for k, v in config.items() if k in _CONFIG_KEYS})
+
     # ----------------------------------------
     # Main Logic
     # ----------------------------------------
     async def run(self, inputs: Dict[str, Any], context: Dict[str, Any]) -> NodeResult:
         try:
-            input_key = self.get_config_value("input_key", "value")
-            required = self.get_config_value("required", True)
-            expected_type = self.get_config_value("type", "text")
+            cfg = self.cfg
+            input_key = cfg.input_key
+            required = cfg.required
+            expected_type = cfg.type
 
             # 1️⃣ Resolve value
             resolved_value, source = self._resolve_value(context, input_key)
@@ -34,12 +112,23 @@ class UserInputNode(BaseNode):
                 if required:
                     msg = f"No value found for input key '{input_key}'"
                     return self.create_result(None, success=False, error=msg)
-                else:
-                    resolved_value = None
 
-            # 2️⃣ Validate & cast
+                # Optional and missing: nothing to validate or cast
+                return self.create_result(
+                    output={"output": None, "value": None},
+                    success=True,
+                    source=source,
+                    input_key=input_key,
+                    expected_type=expected_type,
+                    original_value=None,
+                )
+
+            # 2️⃣ Validate & cast (lists of numbers/booleans are cast per item)
             try:
-                resolved_value = self._validate_and_cast(resolved_value, expected_type)
+                if isinstance(resolved_value, (list, tuple)) and expected_type in (_NUMBER, _BOOL):
+                    resolved_value = self._validate_and_cast_many(resolved_value, expected_type)
+                else:
+                    resolved_value = self._validate_and_cast(resolved_value, expected_type)
             except ValueError as e:
                 return self.create_result(None, success=False, error=str(e))
 
@@ -58,7 +147,7 @@ class UserInputNode(BaseNode):
             )
 
         except Exception as e:
-            self.log_error(f"Input node failed: {e}")
+            self.log_error("Input node failed: %s", e)
             return self.create_result(None, success=False, error=str(e))
 
     # ----------------------------------------
@@ -86,34 +175,18 @@ class UserInputNode(BaseNode):
     # ----------------------------------------
     def _validate_and_cast(self, value: Any, expected_type: str):
         """Validate and cast input based on expected type."""
+        caster = _CASTERS.get(expected_type)
+        return caster(value) if caster is not None else value
 
-        if expected_type == "text":
-            return str(value).strip()
-
-        if expected_type == "number":
-            try:
-                return float(value) if "." in str(value) else int(value)
-            except:
-                raise ValueError(f"Expected number but got '{value}'")
-
-        if expected_type == "boolean":
-            if str(value).lower() in ("true", "1", "yes"):
-                return True
-            if str(value).lower() in ("false", "0", "no"):
-                return False
-            raise ValueError(f"Invalid boolean value: {value}")
-
-        if expected_type == "json":
-            if isinstance(value, (dict, list)):
-                return value
-            raise ValueError("Expected JSON object/array")
-
-        return value
+    def _validate_and_cast_many(self, values, expected_type: str) -> list:
+        """Validate and cast a batch of scalar inputs (number/boolean lists)."""
+        return _cast_many(values, expected_type)
 
     # ----------------------------------------
     # Schema Definitions
     # ----------------------------------------
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_input_schema(cls):
         return {
             "type": "object",
@@ -122,6 +195,7 @@ class UserInputNode(BaseNode):
         }
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_output_schema(cls):
         return {
             "type": "object",
@@ -133,6 +207,7 @@ class UserInputNode(BaseNode):
         }
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_config_schema(cls):
         return {
             "type": "object",
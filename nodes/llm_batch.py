@@ -0,0 +1,254 @@
+"""
+LLM Batch Coordinator - Routes LLM requests through provider Batch APIs.
+
+Requests from concurrent LLMTextGenerationNode runs that share the same
+(provider, model) are collected for a short window and submitted as one
+provider-side batch (OpenAI /v1/batches, Anthropic Message Batches).
+Each caller awaits a future that is resolved once the batch has finished.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass
+import asyncio
+import json
+import logging
+import uuid
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingRequest:
+    """A single prompt waiting to be included in a batch."""
+    custom_id: str
+    prompt: str
+    temperature: float
+    max_tokens: int
+    future: asyncio.Future
+
+
+class LLMBatchCoordinator:
+    """Collects prompts per (provider, model) and submits them as batches."""
+
+    SUPPORTED_PROVIDERS = ("openai", "anthropic")
+
+    _instances: Dict[Tuple[str, str], "LLMBatchCoordinator"] = {}
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        client: Any,
+        max_batch_size: int = 50,
+        flush_interval: float = 0.2,
+        poll_interval: float = 5.0,
+    ):
+        if provider not in self.SUPPORTED_PROVIDERS:
+            raise ValueError(f"Batch mode not supported for provider '{provider}'")
+
+        self.provider = provider
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.poll_interval = poll_interval
+
+        self._client = client
+        # Created per event loop on first submit (see _ensure_collector)
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: set = set()
+
+    @classmethod
+    def for_model(cls, provider: str, model: str, client: Any) -> "LLMBatchCoordinator":
+        """Return the shared coordinator for a provider/model pair."""
+        key = (provider, model)
+        coordinator = cls._instances.get(key)
+        if coordinator is None:
+            coordinator = cls._instances[key] = cls(provider, model, client)
+        else:
+            # The SDK client is replaced when the shared HTTP pool is recreated
+            coordinator._client = client
+        return coordinator
+
+    # ----------------------------------------
+    # Public API
+    # ----------------------------------------
+    async def submit(self, prompt: str, temperature: float, max_tokens: int) -> Tuple[str, Optional[int]]:
+        """Queue a prompt and wait for its (text, tokens) result."""
+        request = _PendingRequest(
+            custom_id=uuid.uuid4().hex,
+            prompt=prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            future=asyncio.get_running_loop().create_future(),
+        )
+
+        self._ensure_collector()
+        await self._queue.put(request)
+        return await request.future
+
+    # ----------------------------------------
+    # Batch collection
+    # ----------------------------------------
+    def _ensure_collector(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Queue and collector belong to one event loop; requests left on a
+            # previous loop's queue have futures nobody can await any more
+            self._queue = asyncio.Queue()
+            self._collector = None
+            self._loop = loop
+        if self._collector is None or self._collector.done():
+            self._collector = loop.create_task(self._collect(self._queue))
+
+    async def _collect(self, queue: asyncio.Queue):
+        """Group queued requests by size or time window and dispatch them."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[_PendingRequest]):
+        """Submit one batch and resolve each caller's future."""
+        logger.info("Submitting %s batch of %d requests (%s)", self.provider, len(batch), self.model)
+
+        try:
+            if self.provider == "openai":
+                results = await self._run_openai_batch(batch)
+            else:
+                results = await self._run_anthropic_batch(batch)
+        except Exception as e:
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        for request in batch:
+            if request.future.done():
+                continue  # caller was cancelled
+
+            outcome = results.get(request.custom_id)
+            if outcome is None:
+                request.future.set_exception(
+                    ValueError(f"No batch result returned for request {request.custom_id}")
+                )
+            elif isinstance(outcome, Exception):
+                request.future.set_exception(outcome)
+            else:
+                request.future.set_result(outcome)
+
+    # ----------------------------------------
+    # PROVIDER: OPENAI (/v1/batches)
+    # ----------------------------------------
+    async def _run_openai_batch(self, batch: List[_PendingRequest]) -> Dict[str, Any]:
+        client = self._client
+
+        lines = [
+            json.dumps({
+                "custom_id": request.custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [{"role": "user", "content": request.prompt}],
+                    "temperature": request.temperature,
+                    "max_tokens": request.max_tokens,
+                },
+            })
+            for request in batch
+        ]
+
+        input_file = await client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        job = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+        while job.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(self.poll_interval)
+            job = await client.batches.retrieve(job.id)
+
+        if job.status != "completed":
+            raise ValueError(f"OpenAI batch {job.id} ended with status '{job.status}'")
+
+        results: Dict[str, Any] = {}
+        for file_id in (job.output_file_id, job.error_file_id):
+            if not file_id:
+                continue
+            content = await client.files.content(file_id)
+            for line in content.text.splitlines():
+                if line.strip():
+                    item = json.loads(line)
+                    results[item["custom_id"]] = self._parse_openai_item(item)
+
+        return results
+
+    @staticmethod
+    def _parse_openai_item(item: Dict[str, Any]):
+        response = item.get("response") or {}
+        body = response.get("body") or {}
+
+        if item.get("error") or response.get("status_code", 200) >= 400:
+            error = item.get("error") or body.get("error")
+            return ValueError(f"OpenAI batch request failed: {error}")
+
+        text = body["choices"][0]["message"]["content"]
+        tokens = (body.get("usage") or {}).get("total_tokens")
+        return text, tokens
+
+    # ----------------------------------------
+    # PROVIDER: ANTHROPIC (Message Batches)
+    # ----------------------------------------
+    async def _run_anthropic_batch(self, batch: List[_PendingRequest]) -> Dict[str, Any]:
+        client = self._client
+
+        job = await client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": request.custom_id,
+                    "params": {
+                        "model": self.model,
+                        "messages": [{"role": "user", "content": request.prompt}],
+                        "temperature": request.temperature,
+                        "max_tokens": request.max_tokens,
+                    },
+                }
+                for request in batch
+            ]
+        )
+
+        while job.processing_status != "ended":
+            await asyncio.sleep(self.poll_interval)
+            job = await client.messages.batches.retrieve(job.id)
+
+        results: Dict[str, Any] = {}
+        async for entry in await client.messages.batches.results(job.id):
+            if entry.result.type == "succeeded":
+                message = entry.result.message
+                results[entry.custom_id] = (message.content[0].text, message.usage.output_tokens)
+            else:
+                results[entry.custom_id] = ValueError(
+                    f"Anthropic batch request {entry.result.type}"
+                )
+
+        return results
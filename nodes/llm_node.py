@@ -2,11 +2,205 @@
 LLM Text Generation Node - Multi-provider (OpenAI, Anthropic, Google Gemini)
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+import asyncio
+import functools
+import hashlib
 import os
+import random
+import re
+import time
 from .base import BaseNode, NodeResult
-from utils.template import interpolate_variables
+from utils.template import interpolate_variables, split_static_prefix
+from utils.http_client import get_http_client
+from .llm_batch import LLMBatchCoordinator
 import inspect
+import logging
+
+# Provider SDKs are optional; import once at load time instead of per call
+try:
+    from openai import AsyncOpenAI
+except ImportError:
+    AsyncOpenAI = None
+
+try:
+    from anthropic import AsyncAnthropic
+except ImportError:
+    AsyncAnthropic = None
+
+try:
+    from google import genai
+except ImportError:
+    genai = None
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEXT_MODEL = os.getenv("DEFAULT_TEXT_MODEL", "gpt-4.1")
+
+
+@dataclass(slots=True, frozen=True)
+class LLMConfig:
+    """Typed view of the LLM node config, built once per node."""
+    provider: Optional[str] = None
+    model: Optional[str] = None
+    prompt: str = ""
+    temperature: float = 0.7
+    max_tokens: int = 2000
+    batch_mode: bool = False
+    stream: bool = False
+    cache: bool = True
+
+
+_CONFIG_KEYS = frozenset(f.name for f in fields(LLMConfig))
+
+
+# Model name -> provider; the named group that matches is the provider
+_PROVIDER_RE = re.compile(
+    r"^(?:(?P<openai>gpt|o1|o-)|.*?(?P<anthropic>claude)|.*?(?P<google>gemini))",
+    re.IGNORECASE,
+)
+
+
+def _render_prompt(template: str, context: Dict[str, Any], inputs: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Render a prompt template and split it into (static_prefix, dynamic_suffix).
+
+    The whole template is rendered once and the literal prefix sliced off, so
+    the suffix is never rendered (or JSON-probed) on its own.
+    """
+    prompt = interpolate_variables(template, context, inputs)
+    prompt = prompt if isinstance(prompt, str) else str(prompt)
+    static_prefix, _ = split_static_prefix(template)
+    if static_prefix and prompt.startswith(static_prefix):
+        return static_prefix, prompt[len(static_prefix):]
+    return "", prompt
+
+
+# Exact-match response cache for deterministic (temperature ~ 0) requests
+_LLM_CACHE: "OrderedDict[bytes, Tuple[str, Optional[int]]]" = OrderedDict()
+_LLM_CACHE_MAXSIZE = 4096
+
+
+def _response_cache_key(provider, model, temperature, max_tokens, prompt) -> bytes:
+    raw = "\x1f".join((provider, str(model), str(temperature), str(max_tokens), prompt))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+
+def _cache_response(key: bytes, value: Tuple[str, Optional[int]]):
+    _LLM_CACHE[key] = value
+    _LLM_CACHE.move_to_end(key)
+    if len(_LLM_CACHE) > _LLM_CACHE_MAXSIZE:
+        _LLM_CACHE.popitem(last=False)
+
+
+# Retry policy for transient provider errors (rate limits, overload, 5xx)
+_MAX_ATTEMPTS = 6
+_BACKOFF_INITIAL = 1.0
+_BACKOFF_MAX = 30.0
+_RETRY_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+_RETRY_ERRORS = frozenset({"APIConnectionError", "APITimeoutError"})
+
+# provider -> monotonic time before which new requests should wait (shared
+# across nodes so one 429 pauses every caller instead of each one hitting it)
+_resume_at: Dict[str, float] = {}
+
+
+def _error_status(exc: Exception) -> Optional[int]:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status is None and isinstance(getattr(exc, "code", None), int):
+        status = exc.code  # google.api_core exceptions
+    return status
+
+
+def _retry_after(exc: Exception) -> Optional[float]:
+    """Seconds the provider asked us to wait, if it said so."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after")
+    if value is None and headers.get("x-ratelimit-remaining-requests") == "0":
+        value = headers.get("x-ratelimit-reset-requests", "").rstrip("s")
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+async def _with_retries(provider: str, call):
+    """Run call() with exponential backoff + jitter on transient errors."""
+    for attempt in range(1, _MAX_ATTEMPTS + 1):
+        pause = _resume_at.get(provider, 0.0) - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+        try:
+            result = call()
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        except Exception as e:
+            status = _error_status(e)
+            retryable = status in _RETRY_STATUS or type(e).__name__ in _RETRY_ERRORS
+            if attempt == _MAX_ATTEMPTS or not retryable:
+                raise
+
+            delay = _retry_after(e)
+            if delay is None:
+                backoff = min(_BACKOFF_MAX, _BACKOFF_INITIAL * 2 ** (attempt - 1))
+                delay = backoff + random.uniform(0, _BACKOFF_INITIAL)
+
+            if status == 429:
+                _resume_at[provider] = max(_resume_at.get(provider, 0.0), time.monotonic() + delay)
+
+            logger.warning(
+                "%s request failed (%s), retry %d/%d in %.1fs",
+                provider, status or type(e).__name__, attempt, _MAX_ATTEMPTS - 1, delay
+            )
+            await asyncio.sleep(delay)
+
+
+def _get_client(provider: str):
+    """Return the shared SDK client for a provider (created on first use).
+
+    OpenAI/Anthropic clients share one pooled httpx.AsyncClient so TLS
+    sessions are reused across LLM calls. SDK retries are disabled because
+    _with_retries() owns the retry policy.
+    """
+    # Keyed on the pooled client too: after close_http_client() a new pool is
+    # created, and SDK clients bound to the closed one must not be reused
+    return _build_client(provider, get_http_client())
+
+
+@functools.lru_cache(maxsize=16)
+def _build_client(provider: str, http_client):
+    if provider == "openai":
+        if AsyncOpenAI is None:
+            raise RuntimeError("openai package not installed")
+        return AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client, max_retries=0
+        )
+
+    if provider == "anthropic":
+        if AsyncAnthropic is None:
+            raise RuntimeError("anthropic package not installed")
+        return AsyncAnthropic(
+            api_key=os.getenv("ANTHROPIC_API_KEY"), http_client=http_client, max_retries=0
+        )
+
+    if provider == "google":
+        if genai is None:
+            raise RuntimeError("google-genai package not installed")
+        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+        return genai
+
+    raise ValueError(f"Unknown provider: {provider}")
 
 
 class LLMTextGenerationNode(BaseNode):
@@ -15,17 +209,26 @@ class LLMTextGenerationNode(BaseNode):
     # ----------------------------------------
     # MAIN RUN METHOD
     # ----------------------------------------
+    def _build_config(self, config: Dict[str, Any]) -> LLMConfig:
+        return LLMConfig(**{k: v for k, v in config.items() if k in _CONFIG_KEYS})
+
     async def run(self, inputs: Dict[str, Any], context: Dict[str, Any]) -> NodeResult:
         try:
+            cfg = self.cfg
             # Merge prompt with upstream inputs
-            prompt_template = self.get_config_value("prompt", "")
-            provider = self.get_config_value("provider", None)
-            model = self.get_config_value("model", None)
-            temperature = self.get_config_value("temperature", 0.7)
-            max_tokens = self.get_config_value("max_tokens", 2000)
-
-            # Interpolate variables from inputs + context
-            prompt = interpolate_variables(prompt_template, context, inputs)
+            prompt_template = cfg.prompt
+            provider = cfg.provider
+            model = cfg.model
+            temperature = cfg.temperature
+            max_tokens = cfg.max_tokens
+            batch_mode = cfg.batch_mode
+            stream = cfg.stream
+            use_cache = cfg.cache
+
+            # Interpolate variables from inputs + context. The literal prefix of
+            # the template is kept separate so providers can cache it.
+            static_prefix, dynamic_suffix = _render_prompt(prompt_template, context, inputs)
+            prompt = static_prefix + dynamic_suffix
 
             # Auto-detect provider if missing
             provider = provider or self._detect_provider(model)
@@ -37,14 +240,51 @@ class LLMTextGenerationNode(BaseNode):
                     error=f"Unsupported provider '{provider}'"
                 )
 
-            self.log_info(f"LLM request via {provider}/{model}")
+            self.log_info("LLM request via %s/%s", provider, model)
+
+            # Deterministic requests are served from the response cache
+            cache_key = cached = None
+            if use_cache and temperature <= 0.01:
+                cache_key = _response_cache_key(provider, model, temperature, max_tokens, prompt)
+                cached = _LLM_CACHE.get(cache_key)
+                if cached is not None:
+                    _LLM_CACHE.move_to_end(cache_key)
+
+            # Streaming: return without calling the provider. The async generator
+            # sends the request when result.stream is first iterated (e.g. by
+            # collect_stream), and text arrives through it from then on
+            if cached is None and stream and not batch_mode and provider in ("openai", "anthropic"):
+                output = {
+                    "text": None,
+                    "output": None,
+                    "prompt_used": prompt,
+                    "provider": provider,
+                    "model": model,
+                    "tokens_used": None
+                }
+                if provider == "openai":
+                    chunks = self._stream_openai(output, prompt, model, temperature, max_tokens)
+                else:
+                    chunks = self._stream_anthropic(
+                        output, static_prefix, dynamic_suffix, model, temperature, max_tokens
+                    )
+                return self.create_result(output, success=True, stream=chunks)
 
             # Provider routing
-            if provider == "openai":
+            if cached is not None:
+                text, tokens = cached
+
+            elif batch_mode and provider in LLMBatchCoordinator.SUPPORTED_PROVIDERS:
+                coordinator = LLMBatchCoordinator.for_model(provider, model, _get_client(provider))
+                text, tokens = await coordinator.submit(prompt, temperature, max_tokens)
+
+            elif provider == "openai":
                 text, tokens = await self._generate_openai(prompt, model, temperature, max_tokens)
 
             elif provider == "anthropic":
-                text, tokens = await self._generate_anthropic(prompt, model, temperature, max_tokens)
+                text, tokens = await self._generate_anthropic(
+                    static_prefix, dynamic_suffix, model, temperature, max_tokens
+                )
 
             elif provider == "google":
                 text, tokens = await self._generate_google(prompt, model, temperature, max_tokens)
@@ -52,6 +292,9 @@ class LLMTextGenerationNode(BaseNode):
             else:
                 raise ValueError(f"Unknown provider: {provider}")
 
+            if cache_key is not None and cached is None:
+                _cache_response(cache_key, (text, tokens))
+
             # Build response
             output = {
                 "text": text,
@@ -62,10 +305,10 @@ class LLMTextGenerationNode(BaseNode):
                 "tokens_used": tokens
             }
 
-            return self.create_result(output, success=True)
+            return self.create_result(output, success=True, cached=cached is not None)
 
         except Exception as e:
-            self.log_error(f"LLM node error: {e}")
+            self.log_error("LLM node error: %s", e)
             return self.create_result(None, success=False, error=str(e))
 
     # ----------------------------------------
@@ -73,15 +316,14 @@ class LLMTextGenerationNode(BaseNode):
     # ----------------------------------------
     async def _generate_openai(self, prompt, model, temperature, max_tokens):
         try:
-            from openai import AsyncOpenAI
-            client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            client = _get_client("openai")
 
-            response = await client.chat.completions.create(
+            response = await _with_retries("openai", lambda: client.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=temperature,
                 max_tokens=max_tokens
-            )
+            ))
 
             text = response.choices[0].message.content
             tokens = response.usage.total_tokens if hasattr(response, "usage") else None
@@ -91,20 +333,61 @@ class LLMTextGenerationNode(BaseNode):
         except Exception as e:
             raise ValueError(f"OpenAI Error: {e}")
 
+    async def _stream_openai(self, output, prompt, model, temperature, max_tokens):
+        """Yield text deltas; fill output["text"/"output"/"tokens_used"] at the end."""
+        parts = []
+        try:
+            client = _get_client("openai")
+
+            response = await _with_retries("openai", lambda: client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                stream_options={"include_usage": True}
+            ))
+
+            async for chunk in response:
+                if chunk.usage:
+                    output["tokens_used"] = chunk.usage.total_tokens
+                if chunk.choices and chunk.choices[0].delta.content:
+                    delta = chunk.choices[0].delta.content
+                    parts.append(delta)
+                    yield delta
+
+        except Exception as e:
+            raise ValueError(f"OpenAI Error: {e}")
+
+        output["text"] = output["output"] = "".join(parts)
+
     # ----------------------------------------
     # PROVIDER: ANTHROPIC
     # ----------------------------------------
-    async def _generate_anthropic(self, prompt, model, temperature, max_tokens):
+    @staticmethod
+    def _anthropic_content(static_prefix, dynamic_suffix):
+        """Static template text first, marked cacheable; interpolated text last."""
+        content = []
+        if static_prefix:
+            content.append({
+                "type": "text",
+                "text": static_prefix,
+                "cache_control": {"type": "ephemeral"},
+            })
+        if dynamic_suffix:
+            content.append({"type": "text", "text": dynamic_suffix})
+        return content
+
+    async def _generate_anthropic(self, static_prefix, dynamic_suffix, model, temperature, max_tokens):
         try:
-            from anthropic import AsyncAnthropic
-            client = AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+            client = _get_client("anthropic")
 
-            response = await client.messages.create(
+            response = await _with_retries("anthropic", lambda: client.messages.create(
                 model=model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=[{"role": "user", "content": self._anthropic_content(static_prefix, dynamic_suffix)}],
                 temperature=temperature,
                 max_tokens=max_tokens
-            )
+            ))
 
             text = response.content[0].text
             tokens = response.usage.output_tokens if hasattr(response, "usage") else None
@@ -114,23 +397,47 @@ class LLMTextGenerationNode(BaseNode):
         except Exception as e:
             raise ValueError(f"Anthropic Error: {e}")
 
+    async def _stream_anthropic(self, output, static_prefix, dynamic_suffix, model, temperature, max_tokens):
+        """Yield text deltas; fill output["text"/"output"/"tokens_used"] at the end."""
+        parts = []
+        try:
+            client = _get_client("anthropic")
+
+            response = await _with_retries("anthropic", lambda: client.messages.create(
+                model=model,
+                messages=[{"role": "user", "content": self._anthropic_content(static_prefix, dynamic_suffix)}],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            ))
+
+            async for event in response:
+                if event.type == "content_block_delta" and event.delta.type == "text_delta":
+                    parts.append(event.delta.text)
+                    yield event.delta.text
+                elif event.type == "message_delta":
+                    output["tokens_used"] = event.usage.output_tokens
+
+        except Exception as e:
+            raise ValueError(f"Anthropic Error: {e}")
+
+        output["text"] = output["output"] = "".join(parts)
+
     # ----------------------------------------
     # PROVIDER: GOOGLE GEMINI
     # ----------------------------------------
     async def _generate_google(self, prompt, model, temperature, max_tokens):
         try:
-            from google import genai
-            genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-
+            genai = _get_client("google")
             client = genai.GenerativeModel(model_name=model)
 
-            response = client.generate_content(
+            response = await _with_retries("google", lambda: client.generate_content(
                 prompt,
                 generation_config={
                     "temperature": temperature,
                     "max_output_tokens": max_tokens
                 }
-            )
+            ))
 
             text = response.text
             tokens = None  # Gemini API does not always return usage tokens
@@ -145,26 +452,14 @@ class LLMTextGenerationNode(BaseNode):
     # ----------------------------------------
     def _detect_provider(self, model: str) -> str:
         """Automatically determine provider based on model name."""
-        if not model:
-            return "openai"
-
-        model = model.lower()
-
-        if model.startswith(("gpt", "o1", "o-")):
-            return "openai"
-
-        if "claude" in model:
-            return "anthropic"
-
-        if "gemini" in model:
-            return "google"
-
-        return "openai"
+        match = _PROVIDER_RE.match(model or "")
+        return match.lastgroup if match else "openai"
 
     # ----------------------------------------
     # SCHEMAS
     # ----------------------------------------
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_input_schema(cls):
         return {
             "type": "object",
@@ -174,6 +469,7 @@ class LLMTextGenerationNode(BaseNode):
         }
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_output_schema(cls):
         return {
             "type": "object",
@@ -189,6 +485,7 @@ class LLMTextGenerationNode(BaseNode):
         }
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_config_schema(cls):
         return {
             "type": "object",
@@ -200,7 +497,7 @@ class LLMTextGenerationNode(BaseNode):
                 },
                 "model": {
                     "type": "string",
-                    "default": os.getenv("DEFAULT_TEXT_MODEL", "gpt-4.1")
+                    "default": DEFAULT_TEXT_MODEL
                 },
                 "prompt": {
                     "type": "string",
@@ -208,7 +505,22 @@ class LLMTextGenerationNode(BaseNode):
                     "ui:widget": "textarea"
                 },
                 "temperature": {"type": "number", "default": 0.7},
-                "max_tokens": {"type": "integer", "default": 2000}
+                "max_tokens": {"type": "integer", "default": 2000},
+                "batch_mode": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Submit via the provider Batch API (OpenAI/Anthropic): higher latency, lower cost"
+                },
+                "stream": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Stream tokens (OpenAI/Anthropic) through the result's stream"
+                },
+                "cache": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Reuse responses for identical requests when temperature is 0"
+                }
             },
             "required": ["prompt"]
         }
@@ -1,8 +1,74 @@
 """Output Node - Return final workflow results."""
 
 from typing import Dict, Any
+import functools
+import json
 from .base import BaseNode, NodeResult
-from utils.template import interpolate_variables
+from utils.template import interpolate_variables, get_nested_value
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+# Returned by field accessors when the source is absent (field is skipped)
+_MISSING = object()
+
+
+def _compile_accessor(field: str):
+    """Build a callable that extracts one configured field from the inputs."""
+    if "." not in field:
+        return lambda inputs: inputs.get(field, _MISSING)
+
+    node_id, field_path = field.split(".", 1)
+    return lambda inputs: (
+        get_nested_value(inputs[node_id], field_path) if node_id in inputs else _MISSING
+    )
+
+
+# ----------------------------------------
+# Output formatters (keyed by "format" config)
+# ----------------------------------------
+_KV_FMT = "{}: {}".format
+
+
+def _fmt_identity(output):
+    return output
+
+
+def _fmt_json(output):
+    if orjson is not None:
+        return orjson.dumps(
+            output,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    return json.dumps(output, default=str, ensure_ascii=False)
+
+
+def _fmt_text(output):
+    try:
+        keys, values = output.keys(), output.values()
+    except AttributeError:
+        return str(output)
+    return "\n".join(map(_KV_FMT, keys, values))
+
+
+def _fmt_list(output):
+    if isinstance(output, dict):
+        return list(output.values())
+    if isinstance(output, list):
+        return output
+    return [output]
+
+
+_FORMATTERS = {
+    "auto": _fmt_identity,
+    "json": _fmt_json,
+    "text": _fmt_text,
+    "list": _fmt_list,
+}
 
 
 class OutputNode(BaseNode):
@@ -10,6 +76,13 @@ class OutputNode(BaseNode):
     
     This node collects data from previous nodes and formats it for output.
     """
+
+    def __init__(self, node_id: str, config: Dict[str, Any]):
+        super().__init__(node_id, config)
+
+        # Field specs are parsed once here instead of on every run
+        fields = self.get_config_value("fields", None)
+        self._accessors = tuple((f, _compile_accessor(f)) for f in fields) if fields else ()
     
     async def run(self, inputs: Dict[str, Any], context: Dict[str, Any]) -> NodeResult:
         """Execute the output node.
@@ -25,53 +98,28 @@ class OutputNode(BaseNode):
             # Get configuration
             format_type = self.get_config_value("format", "auto")
             template = self.get_config_value("template", None)
-            fields = self.get_config_value("fields", None)
             
-            self.log_info(f"Preparing output in format: {format_type}")
+            self.log_info("Preparing output in format: %s", format_type)
             
             # Determine output based on format
             if template:
                 # Use template to format output
                 output = interpolate_variables(template, context, inputs)
-            elif fields:
+            elif self._accessors:
                 # Select specific fields from inputs
                 output = {}
-                for field in fields:
-                    if "." in field:
-                        # Handle nested field access
-                        parts = field.split(".")
-                        node_id = parts[0]
-                        field_path = ".".join(parts[1:])
-                        if node_id in inputs:
-                            from utils.template import get_nested_value
-                            output[field] = get_nested_value(inputs[node_id], field_path)
-                    else:
-                        # Direct field access
-                        if field in inputs:
-                            output[field] = inputs[field]
+                for field, accessor in self._accessors:
+                    value = accessor(inputs)
+                    if value is not _MISSING:
+                        output[field] = value
             else:
                 # Return all inputs as-is
                 output = inputs
             
             # Apply format transformation
-            if format_type == "json":
-                formatted_output = output
-            elif format_type == "text":
-                if isinstance(output, dict):
-                    formatted_output = "\n".join(f"{k}: {v}" for k, v in output.items())
-                else:
-                    formatted_output = str(output)
-            elif format_type == "list":
-                if isinstance(output, dict):
-                    formatted_output = list(output.values())
-                elif isinstance(output, list):
-                    formatted_output = output
-                else:
-                    formatted_output = [output]
-            else:  # auto
-                formatted_output = output
+            formatted_output = _FORMATTERS.get(format_type, _fmt_identity)(output)
             
-            self.log_info(f"Output prepared: {type(formatted_output).__name__}")
+            self.log_info("Output prepared: %s", type(formatted_output).__name__)
             
             return self.create_result(
                 output={
@@ -83,7 +131,7 @@ class OutputNode(BaseNode):
             )
             
         except Exception as e:
-            self.log_error(f"Error in output node: {e}")
+            self.log_error("Error in output node: %s", e)
             return self.create_result(
                 output=None,
                 success=False,
@@ -91,6 +139,7 @@ class OutputNode(BaseNode):
             )
     
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_input_schema(cls) -> Dict[str, Any]:
         """Define input schema."""
         return {
@@ -100,6 +149,7 @@ class OutputNode(BaseNode):
         }
     
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_output_schema(cls) -> Dict[str, Any]:
         """Define output schema."""
         return {
@@ -122,6 +172,7 @@ class OutputNode(BaseNode):
         }
     
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_config_schema(cls) -> Dict[str, Any]:
         """Define configuration schema."""
         return {
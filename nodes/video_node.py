@@ -2,11 +2,155 @@
 Video Generation Node - Supports Replicate Video Models + Google Veo
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import difflib
+import functools
+import hashlib
 import os
 import asyncio
+import random
+import time
+import httpx
 from .base import BaseNode
 from utils.template import interpolate_variables
+from utils.http_client import HTTP_LIMITS
+
+try:
+    import replicate
+except ImportError:
+    replicate = None
+
+try:
+    from google import genai
+except ImportError:
+    genai = None
+
+
+# Provider credentials, read from the environment once on first use (not at
+# import, so values loaded later via load_dotenv() are still picked up)
+_TOKENS: Dict[str, str] = {}
+
+
+def _get_token(env_var: str) -> Optional[str]:
+    token = _TOKENS.get(env_var)
+    if token is None:
+        token = os.getenv(env_var)
+        if token:
+            _TOKENS[env_var] = token
+    return token
+
+
+@functools.lru_cache(maxsize=None)
+def _get_replicate_client(api_token: str):
+    """
+    Return a Replicate client per token, reused across runs and polls.
+
+    Replicate needs its own base URL and auth headers, so it keeps a
+    dedicated pooled transport rather than the shared AsyncClient.
+    """
+    return replicate.Client(
+        api_token=api_token,
+        transport=httpx.AsyncHTTPTransport(limits=HTTP_LIMITS),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_genai_client(api_key: str):
+    """Return a google-genai client per key (its .aio surface is async)."""
+    return genai.Client(api_key=api_key)
+
+
+# Prediction id -> Event set by the Replicate webhook route, so a waiting
+# poller wakes as soon as the job completes instead of on its next tick
+_REPLICATE_EVENTS: Dict[str, asyncio.Event] = {}
+
+_REPLICATE_TERMINAL = frozenset({"succeeded", "failed", "canceled"})
+
+
+def notify_replicate_prediction(prediction_id: str) -> bool:
+    """Wake the poller waiting on `prediction_id`. Returns False if none is."""
+    event = _REPLICATE_EVENTS.get(prediction_id)
+    if event is None:
+        return False
+    event.set()
+    return True
+
+
+class _VideoResultCache:
+    """
+    In-process cache of finished video jobs keyed by request parameters.
+
+    Entries expire after `ttl` seconds (provider URLs are short-lived). When
+    full, the entry with the lowest frequency x generation-cost product is
+    evicted (LCBFU), so expensive, frequently repeated renders stay cached.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3000.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> [result, stored_at, hits, cost_seconds]
+        self._entries: Dict[str, list] = {}
+
+    @staticmethod
+    def make_key(provider, model, duration, fps, prompt) -> str:
+        normalized = " ".join(str(prompt).split()).lower()
+        raw = f"{provider}|{model}|{duration}|{fps}|{normalized}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[1] > self.ttl:
+            del self._entries[key]
+            return None
+        entry[2] += 1
+        return entry[0]
+
+    def put(self, key: str, result: Dict[str, Any], cost: float):
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            self._evict()
+        self._entries[key] = [result, time.monotonic(), 1, max(cost, 1e-3)]
+
+    def _evict(self):
+        now = time.monotonic()
+        expired = [k for k, e in self._entries.items() if now - e[1] > self.ttl]
+        if expired:
+            for k in expired:
+                del self._entries[k]
+            return
+        victim = min(self._entries, key=lambda k: self._entries[k][2] * self._entries[k][3])
+        del self._entries[victim]
+
+
+_VIDEO_CACHE = _VideoResultCache()
+
+# Last replicate run per model ({"prompt", "url", "seed"}), for reuse_prior
+_PRIOR_RUNS = _VideoResultCache(maxsize=64)
+_REUSE_SIMILARITY = 0.85
+_REUSE_STRENGTH = 0.5
+
+
+def _prompt_similarity(a: str, b: str) -> float:
+    """Edit-distance style similarity of two prompts in [0, 1]."""
+    a = " ".join(str(a).split()).lower()
+    b = " ".join(str(b).split()).lower()
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+
+# (keyword in lowercased model name, replicate model tag); first match wins
+_REPLICATE_MODEL_TAGS = (
+    ("zeroscope", "anotherjesse/zeroscope-v2-xl:9f747673945c62801b13b84701c783929c0ee784e4748ec062204894dda1a351"),
+    ("animate", "lucataco/animate-diff:beecf59c4aee8d81bf04f0381033dfa10dc16e845b4ae00d281e2fa377e48a9f"),
+    ("flux", "black-forest-labs/flux-1.1-pro"),  # Flux video (optional future)
+)
+
+# (keyword in lowercased model name, provider)
+_PROVIDER_TAGS = (
+    ("veo", "google"),
+    ("zeroscope", "replicate"),
+    ("animate", "replicate"),
+)
 
 
 class VideoGenerationNode(BaseNode):
@@ -26,115 +170,161 @@ class VideoGenerationNode(BaseNode):
             # Auto-detect provider
             provider = provider or self._detect_provider(model)
 
-            self.log_info(f"[VideoNode] Provider={provider}, Model={model}, Duration={duration}s")
-
-            # Route to correct provider
-            if provider == "replicate":
-                result = await self._generate_replicate(prompt, model, duration, fps)
-
-            elif provider == "google":
-                result = await self._generate_google_veo(prompt, model, duration)
-
-            else:
-                return self.create_result(
-                    None,
-                    success=False,
-                    error=f"Unsupported provider '{provider}'"
-                )
-
-            video_url = result.get("url")
-
+            self.log_info("[VideoNode] Provider=%s, Model=%s, Duration=%ss", provider, model, duration)
+
+            # Reuse a recent render of the same request
+            cache_key = None
+            result = None
+            if self.get_config_value("cache", True):
+                cache_key = _VIDEO_CACHE.make_key(provider, model, duration, fps, prompt)
+                result = _VIDEO_CACHE.get(cache_key)
+            cached = result is not None
+
+            if not cached:
+                started = time.monotonic()
+
+                # Route to correct provider
+                if provider == "replicate":
+                    result = await self._generate_replicate(
+                        prompt, model, duration, fps,
+                        reuse_prior=self.get_config_value("reuse_prior", False)
+                    )
+
+                elif provider == "google":
+                    result = await self._generate_google_veo(prompt, model, duration)
+
+                else:
+                    return self.create_result(
+                        None,
+                        success=False,
+                        error=f"Unsupported provider '{provider}'"
+                    )
+
+                if cache_key is not None and result.get("url"):
+                    # Store a copy so the response fields added below stay out of the cache
+                    _VIDEO_CACHE.put(cache_key, dict(result), time.monotonic() - started)
+
+            # Providers return {"url": ...}; build the output from a copy so the
+            # (possibly cached) provider result is never modified
             output = {
-                "url": video_url,
-                "output": video_url,
+                **result,
+                "output": result.get("url"),
                 "prompt_used": prompt,
                 "model": model,
                 "provider": provider,
                 "duration": duration,
                 "fps": fps,
-                **result
             }
 
-            return self.create_result(output, success=True)
+            return self.create_result(output, success=True, cached=cached)
 
         except Exception as e:
-            self.log_error(f"Video generation failed: {e}")
+            self.log_error("Video generation failed: %s", e)
             return self.create_result(None, success=False, error=str(e))
 
     # =========================================================================
     # PROVIDER 1: REPLICATE (Zeroscope, AnimateDiff, Flux Video etc.)
     # =========================================================================
-    async def _generate_replicate(self, prompt, model, duration, fps):
-        import replicate
-        
-        api_key = os.getenv("REPLICATE_API_TOKEN")
+    async def _generate_replicate(self, prompt, model, duration, fps, reuse_prior=False):
+        if replicate is None:
+            raise RuntimeError("replicate package not installed")
+
+        api_key = _get_token("REPLICATE_API_TOKEN")
         if not api_key:
             raise ValueError("REPLICATE_API_TOKEN not set")
 
-        os.environ["REPLICATE_API_TOKEN"] = api_key
-
         model_name = self._resolve_replicate_model(model)
+        client = _get_replicate_client(api_key)
 
-        # Send job
-        prediction = await replicate.async_run(
-            model_name,
-            input={
+        # Create the prediction without blocking on it; completion arrives via
+        # webhook (when REPLICATE_WEBHOOK_URL is set) or the polling fallback
+        params: Dict[str, Any] = {
+            "input": {
                 "prompt": prompt,
                 "fps": fps,
                 "num_frames": duration * fps
             }
-        )
+        }
 
-        # Poll until job is complete
-        url = await self._poll_replicate(prediction)
+        # Near-identical follow-up prompt: start from the previous video with
+        # its seed so the model can skip most of the early denoising
+        seed = None
+        if reuse_prior:
+            started = time.monotonic()
+            prior = _PRIOR_RUNS.get(model_name)
+            if prior and _prompt_similarity(prior["prompt"], prompt) >= _REUSE_SIMILARITY:
+                seed = prior["seed"]
+                params["input"].update(image=prior["url"], strength=_REUSE_STRENGTH)
+                self.log_info("[VideoNode] Reusing prior run of %s (seed=%s)", model_name, seed)
+            else:
+                seed = random.randrange(2 ** 31)
+            params["input"]["seed"] = seed
+
+        webhook_url = os.getenv("REPLICATE_WEBHOOK_URL")
+        if webhook_url:
+            params["webhook"] = webhook_url
+            params["webhook_events_filter"] = ["completed"]
+
+        if ":" in model_name:
+            params["version"] = model_name.split(":", 1)[1]
+            prediction = await client.predictions.async_create(**params)
+        else:
+            prediction = await client.models.predictions.async_create(model=model_name, **params)
+
+        # Wait until job is complete
+        url = await self._poll_replicate(client, prediction)
+
+        if reuse_prior and url:
+            _PRIOR_RUNS.put(
+                model_name,
+                {"prompt": prompt, "url": url, "seed": seed},
+                time.monotonic() - started
+            )
 
         return {"url": url}
 
-    async def _poll_replicate(self, prediction):
-        """Poll replicate until the job finishes."""
-        import replicate
-
-        prediction_id = prediction.get("id")
-        if not prediction_id:
-            # Some models return output directly (very rare)
-            output = prediction
-            if isinstance(output, list):
-                return output[0]
-            return output
-
-        # Poll prediction
-        for _ in range(120):  # ~2 minutes max
-            pred = await replicate.predictions.async_get(prediction_id)
-
-            if pred.status == "succeeded":
-                out = pred.output
-                if isinstance(out, list):
-                    return out[0]
-                return out
+    async def _poll_replicate(self, client, prediction):
+        """Wait for a replicate prediction to finish (webhook or polling)."""
+        prediction_id = prediction.id
 
-            if pred.status == "failed":
-                raise RuntimeError(f"Replicate video failed: {pred.error}")
+        # Wake on the webhook event; the timeout doubles as a backoff poll
+        # with full jitter in case the callback never arrives (~2 minutes max)
+        event = _REPLICATE_EVENTS.setdefault(prediction_id, asyncio.Event())
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 120
+        delay = 0.3
 
-            await asyncio.sleep(2)
-
-        raise TimeoutError("Replicate video generation timed out.")
-
-    def _resolve_replicate_model(self, model: str):
-        """Auto pick model tag for replicate."""
+        try:
+            pred = prediction
+            while True:
+                if pred.status == "succeeded":
+                    out = pred.output
+                    if isinstance(out, list):
+                        return out[0]
+                    return out
+
+                if pred.status in _REPLICATE_TERMINAL:
+                    raise RuntimeError(f"Replicate video {pred.status}: {pred.error}")
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise TimeoutError("Replicate video generation timed out.")
+
+                try:
+                    await asyncio.wait_for(event.wait(), min(random.uniform(0, delay), remaining))
+                except asyncio.TimeoutError:
+                    delay = min(delay * 1.5, 5.0)
+                event.clear()
+
+                pred = await client.predictions.async_get(prediction_id)
+        finally:
+            _REPLICATE_EVENTS.pop(prediction_id, None)
+
+    @staticmethod
+    def _resolve_replicate_model(model: str):
+        """Auto pick model tag for replicate (first keyword match, else as-is)."""
         m = model.lower()
-
-        if "zeroscope" in m:
-            return "anotherjesse/zeroscope-v2-xl:9f747673945c62801b13b84701c783929c0ee784e4748ec062204894dda1a351"
-
-        if "animate" in m:
-            return "lucataco/animate-diff:beecf59c4aee8d81bf04f0381033dfa10dc16e845b4ae00d281e2fa377e48a9f"
-
-        # Flux video (optional future)
-        if "flux" in m:
-            return "black-forest-labs/flux-1.1-pro"
-
-        # Default fallback
-        return model
+        return next((tag for keyword, tag in _REPLICATE_MODEL_TAGS if keyword in m), model)
 
     # =========================================================================
     # PROVIDER 2: GOOGLE VEO (REAL IMPLEMENTATION)
@@ -145,54 +335,63 @@ class VideoGenerationNode(BaseNode):
         Example model names:
         - "veo-1.5"
         """
-        from google import genai
+        if genai is None:
+            raise RuntimeError("google-genai package not installed")
 
-        api_key = os.getenv("GOOGLE_API_KEY")
+        api_key = _get_token("GOOGLE_API_KEY")
         if not api_key:
             raise ValueError("GOOGLE_API_KEY not set")
 
-        genai.configure(api_key=api_key)
-
         model_name = model or "veo-1.5"
-        client = genai.GenerativeModel(model_name)
+        client = _get_genai_client(api_key)
 
-        response = client.generate_video(
+        # Async API: starts a long-running operation without blocking the loop
+        operation = await client.aio.models.generate_videos(
+            model=model_name,
             prompt=prompt,
-            duration=duration,
+            config={"duration_seconds": duration},
         )
 
-        # Google returns .videos[0].uri
+        # Poll the operation with exponential backoff + full jitter (~10 minutes max)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 600
+        delay = 1.0
+
+        while not operation.done:
+            if loop.time() >= deadline:
+                raise TimeoutError("Google Veo video generation timed out.")
+            await asyncio.sleep(random.uniform(0, delay))
+            delay = min(delay * 1.5, 10.0)
+            operation = await client.aio.operations.get(operation)
+
+        if operation.error:
+            raise RuntimeError(f"Google Veo video failed: {operation.error}")
+
+        # Google returns .generated_videos[0].video.uri
         try:
-            video_url = response.videos[0].uri
-        except:
-            raise RuntimeError("Google Veo response malformed")
+            video_url = operation.response.generated_videos[0].video.uri
+        except (AttributeError, IndexError, KeyError, TypeError) as e:
+            raise RuntimeError(f"Google Veo response malformed: {e}") from e
 
         return {"url": video_url}
 
     # =========================================================================
     # AUTO PROVIDER DETECTION
     # =========================================================================
-    def _detect_provider(self, model: str):
+    @staticmethod
+    def _detect_provider(model: str):
         if not model:
             return "replicate"
 
+        # Anything unmatched (incl. full "owner/name" tags) goes to replicate
         m = model.lower()
-
-        if "veo" in m:
-            return "google"
-
-        if "zeroscope" in m or "animate" in m:
-            return "replicate"
-
-        if "/" in m:  # full replicate tag
-            return "replicate"
-
-        return "replicate"
+        return next((provider for keyword, provider in _PROVIDER_TAGS if keyword in m), "replicate")
 
     # =========================================================================
     # SCHEMAS
     # =========================================================================
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_input_schema(cls):
         return {
             "type": "object",
@@ -202,6 +401,7 @@ class VideoGenerationNode(BaseNode):
         }
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_output_schema(cls):
         return {
             "type": "object",
@@ -215,6 +415,7 @@ class VideoGenerationNode(BaseNode):
         }
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_config_schema(cls):
         return {
             "type": "object",
@@ -231,6 +432,16 @@ class VideoGenerationNode(BaseNode):
                 "prompt": {"type": "string"},
                 "duration": {"type": "number", "default": 4},
                 "fps": {"type": "number", "default": 24},
+                "cache": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Reuse a recent video for an identical request"
+                },
+                "reuse_prior": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Seed Replicate runs from the previous video when the prompt is nearly the same"
+                },
             },
             "required": ["prompt"]
         }
@@ -1,7 +1,15 @@
 """Storage layer for workflows and execution results."""
 
 from .database import Database, get_database
-from .models import WorkflowModel, ExecutionModel, ExecutionStatus
+from .models import (
+    WorkflowModel,
+    ExecutionModel,
+    ExecutionStatus,
+    NodeResultModel,
+    WorkflowSummary,
+    ExecutionSummary,
+    bulk_insert_executions,
+)
 from .serialization import WorkflowSerializer
 
 __all__ = [
@@ -10,6 +18,10 @@ __all__ = [
     "WorkflowModel",
     "ExecutionModel",
     "ExecutionStatus",
+    "NodeResultModel",
+    "WorkflowSummary",
+    "ExecutionSummary",
+    "bulk_insert_executions",
     "WorkflowSerializer",
 ]
 
@@ -3,13 +3,64 @@ Async database layer for workflows and executions.
 Aligned with Mini-N8N executor, routes, and workflow engine.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, update, insert, event
+from sqlalchemy.orm import undefer_group, attributes
 from contextlib import asynccontextmanager
+import asyncio
+import logging
 import os
 
-from .models import Base, WorkflowModel, ExecutionModel, ExecutionStatus
+try:
+    import orjson
+except ImportError:  # fall back to SQLAlchemy's stdlib json
+    orjson = None
+
+from .models import (
+    Base,
+    WorkflowModel,
+    ExecutionModel,
+    ExecutionStatus,
+    NodeResultModel,
+    WorkflowSummary,
+    ExecutionSummary,
+    bulk_insert_executions,
+)
+
+logger = logging.getLogger(__name__)
+
+# Background execution writes (see update_execution_async)
+_WRITE_QUEUE_SIZE = 1024
+_WRITE_BATCH = 64
+_WRITE_LINGER = 0.05
+_FLUSH_TIMEOUT = 30.0
+
+
+# ---------------------------------------------------------
+# JSON column serialization
+# ---------------------------------------------------------
+def _json_default(obj: Any) -> Any:
+    """Types orjson does not encode natively (enums/dataclasses/datetimes are)."""
+    # Pydantic models → dict
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _json_dumps(value: Any) -> str:
+    return orjson.dumps(
+        value,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+        default=_json_default,
+    ).decode()
+
+
+_JSON_ENGINE_KWARGS: Dict[str, Any] = (
+    {"json_serializer": _json_dumps, "json_deserializer": orjson.loads} if orjson else {}
+)
 
 
 # ---------------------------------------------------------
@@ -25,7 +76,28 @@ class Database:
         elif database_url.startswith("postgresql://"):
             database_url = database_url.replace("postgresql://", "postgresql+asyncpg://")
 
-        self.engine = create_async_engine(database_url, echo=False)
+        is_sqlite = database_url.startswith("sqlite")
+
+        self.engine = create_async_engine(
+            database_url,
+            echo=False,
+            # executemany INSERTs are sent as multi-row VALUES batches
+            insertmanyvalues_page_size=1000,
+            **_JSON_ENGINE_KWARGS,
+            **({"connect_args": {"timeout": 30}} if is_sqlite else {})
+        )
+
+        if is_sqlite:
+            # WAL lets readers run alongside the writer; NORMAL skips the
+            # per-commit fsync that FULL does (still durable at checkpoints)
+            @event.listens_for(self.engine.sync_engine, "connect")
+            def _sqlite_pragmas(dbapi_conn, _):
+                cur = dbapi_conn.cursor()
+                cur.execute("PRAGMA journal_mode=WAL")
+                cur.execute("PRAGMA synchronous=NORMAL")
+                cur.execute("PRAGMA temp_store=MEMORY")
+                cur.execute("PRAGMA mmap_size=268435456")
+                cur.close()
 
         self.async_session = async_sessionmaker(
             self.engine,
@@ -33,6 +105,14 @@ class Database:
             expire_on_commit=False
         )
 
+        # Created on first queued write, since __init__ may run outside a loop
+        self._write_q: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._writer_loop: Optional[asyncio.AbstractEventLoop] = None
+        # execution_id -> error from a failed background write, raised on
+        # the next update_execution_async() call for that execution
+        self._write_errors: Dict[str, Exception] = {}
+
     # ---------------------------------------------------------
     # Initialization
     # ---------------------------------------------------------
@@ -40,8 +120,24 @@ class Database:
         """Create all database tables (idempotent)."""
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(self._ensure_indexes)
+
+    @staticmethod
+    def _ensure_indexes(sync_conn):
+        """Create model indexes missing from tables that predate them."""
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(sync_conn, checkfirst=True)
 
     async def close(self):
+        if self._writer_task is not None:
+            try:
+                await self._wait_for_writes()
+            except Exception:
+                logger.exception("Queued execution updates were not all written")
+            finally:
+                self._writer_task.cancel()
+                self._writer_task = None
         await self.engine.dispose()
 
     @asynccontextmanager
@@ -89,23 +185,54 @@ class Database:
             )
             return list(result.scalars().all())
 
-    async def update_workflow(self, workflow_id: str, workflow_data: Dict[str, Any]) -> Optional[WorkflowModel]:
+    async def list_workflows_lite(self, limit: int = 100, offset: int = 0) -> List[WorkflowSummary]:
+        """List view of workflows: selects only the summary columns."""
         async with self.session() as session:
             result = await session.execute(
-                select(WorkflowModel).where(WorkflowModel.id == workflow_id)
+                select(
+                    WorkflowModel.id,
+                    WorkflowModel.name,
+                    WorkflowModel.updated_at,
+                    WorkflowModel.version,
+                )
+                .order_by(WorkflowModel.updated_at.desc())
+                .limit(limit)
+                .offset(offset)
             )
-            workflow = result.scalar_one_or_none()
+            return [WorkflowSummary(*row) for row in result]
 
-            if workflow:
-                workflow.name = workflow_data.get("name", workflow.name)
-                workflow.description = workflow_data.get("description", workflow.description)
-                workflow.data = workflow_data
-                workflow.version = workflow_data.get("version", workflow.version)
+    async def update_workflow(
+        self,
+        workflow_id: str,
+        workflow_data: Dict[str, Any],
+        return_model: bool = False
+    ) -> Union[Optional[WorkflowModel], bool]:
+        """
+        Update a workflow with a single UPDATE statement.
+
+        Returns whether the row existed, or the refreshed model when
+        return_model=True (costs an extra SELECT).
+        """
+        values: Dict[str, Any] = {"data": workflow_data}
+        for key in ("name", "description", "version"):
+            if key in workflow_data:
+                values[key] = workflow_data[key]
 
-                await session.flush()
-                await session.refresh(workflow)
+        async with self.session() as session:
+            res = await session.execute(
+                update(WorkflowModel)
+                .where(WorkflowModel.id == workflow_id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
 
-            return workflow
+            if not return_model:
+                return (res.rowcount or 0) > 0
+
+            result = await session.execute(
+                select(WorkflowModel).where(WorkflowModel.id == workflow_id)
+            )
+            return result.scalar_one_or_none()
 
     async def delete_workflow(self, workflow_id: str) -> bool:
         async with self.session() as session:
@@ -131,6 +258,11 @@ class Database:
             await session.refresh(execution)
             return execution
 
+    async def insert_executions(self, rows: List[Dict[str, Any]]) -> None:
+        """Bulk-create executions from column dicts (see bulk_insert_executions)."""
+        async with self.session() as session:
+            await bulk_insert_executions(session, rows)
+
     async def get_execution(self, execution_id: str) -> Optional[ExecutionModel]:
         async with self.session() as session:
             result = await session.execute(
@@ -138,6 +270,28 @@ class Database:
             )
             return result.scalar_one_or_none()
 
+    async def get_execution_full(self, execution_id: str) -> Optional[ExecutionModel]:
+        """
+        Like get_execution(), but also loads output_data and node_results.
+
+        node_results is materialized from execution_node_results when the
+        legacy JSON column is empty.
+        """
+        async with self.session() as session:
+            result = await session.execute(
+                select(ExecutionModel)
+                .options(undefer_group("blobs"))
+                .where(ExecutionModel.id == execution_id)
+            )
+            execution = result.scalar_one_or_none()
+
+            if execution is not None and execution.node_results is None:
+                node_results = await self._select_node_results(session, execution_id)
+                if node_results:
+                    attributes.set_committed_value(execution, "node_results", node_results)
+
+            return execution
+
     async def list_executions(self, workflow_id: Optional[str] = None, limit: int = 100, offset: int = 0) -> List[ExecutionModel]:
         async with self.session() as session:
             query = select(ExecutionModel)
@@ -150,6 +304,25 @@ class Database:
             result = await session.execute(query)
             return list(result.scalars().all())
 
+    async def list_executions_lite(self, workflow_id: Optional[str] = None, limit: int = 100, offset: int = 0) -> List[ExecutionSummary]:
+        """List view of executions: selects only the summary columns."""
+        async with self.session() as session:
+            query = select(
+                ExecutionModel.id,
+                ExecutionModel.workflow_id,
+                ExecutionModel.status,
+                ExecutionModel.created_at,
+                ExecutionModel.execution_time,
+            )
+
+            if workflow_id:
+                query = query.where(ExecutionModel.workflow_id == workflow_id)
+
+            query = query.order_by(ExecutionModel.created_at.desc()).limit(limit).offset(offset)
+
+            result = await session.execute(query)
+            return [ExecutionSummary(*row) for row in result]
+
     async def update_execution(
         self,
         execution_id: str,
@@ -160,37 +333,199 @@ class Database:
         execution_order: Optional[List[str]] = None,
         started_at: Optional[Any] = None,
         finished_at: Optional[Any] = None,
-        execution_time: Optional[float] = None
-    ) -> Optional[ExecutionModel]:
+        execution_time: Optional[float] = None,
+        return_model: bool = False
+    ) -> Union[Optional[ExecutionModel], bool]:
+        """
+        Update an execution with a single UPDATE statement.
+
+        Only arguments that are not None are written. Returns whether the row
+        existed, or the refreshed model when return_model=True.
+        """
+        values = self._execution_values(
+            status=status,
+            output_data=output_data,
+            error=error,
+            node_results=node_results,
+            execution_order=execution_order,
+            started_at=started_at,
+            finished_at=finished_at,
+            execution_time=execution_time,
+        )
 
         async with self.session() as session:
+            if values:
+                res = await session.execute(
+                    update(ExecutionModel)
+                    .where(ExecutionModel.id == execution_id)
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+                if not return_model:
+                    return (res.rowcount or 0) > 0
+
             result = await session.execute(
                 select(ExecutionModel).where(ExecutionModel.id == execution_id)
             )
             execution = result.scalar_one_or_none()
+            return execution if return_model else execution is not None
 
-            if execution:
-                if status is not None:
-                    execution.status = status
-                if output_data is not None:
-                    execution.output_data = output_data
-                if error is not None:
-                    execution.error = error
-                if node_results is not None:
-                    execution.node_results = node_results
-                if execution_order is not None:
-                    execution.execution_order = execution_order
-                if started_at is not None:
-                    execution.started_at = started_at
-                if finished_at is not None:
-                    execution.finished_at = finished_at
-                if execution_time is not None:
-                    execution.execution_time = execution_time
-
-                await session.flush()
-                await session.refresh(execution)
+    # ---------------------------------------------------------
+    # Node Result Operations
+    # ---------------------------------------------------------
+    async def append_node_results(self, execution_id: str, results: Dict[str, Any]) -> None:
+        """Store a batch of node results (node_id -> result) in one INSERT."""
+        if not results:
+            return
 
-            return execution
+        async with self.session() as session:
+            await session.execute(
+                insert(NodeResultModel).values([
+                    {"execution_id": execution_id, "node_id": node_id, "result": result}
+                    for node_id, result in results.items()
+                ])
+            )
+
+    @staticmethod
+    async def _select_node_results(session: AsyncSession, execution_id: str) -> Dict[str, Any]:
+        """node_id -> result for an execution, in insertion order."""
+        result = await session.execute(
+            select(NodeResultModel.node_id, NodeResultModel.result)
+            .where(NodeResultModel.execution_id == execution_id)
+            .order_by(NodeResultModel.id)
+        )
+        return {node_id: value for node_id, value in result}
+
+    @staticmethod
+    def _execution_values(**fields: Any) -> Dict[str, Any]:
+        """Column values for an execution UPDATE (None means "leave as is")."""
+        return {key: value for key, value in fields.items() if value is not None}
+
+    async def update_execution_async(
+        self,
+        execution_id: str,
+        flush: bool = False,
+        **fields: Any
+    ) -> None:
+        """
+        Queue an execution update for the background writer.
+
+        Takes the same column arguments as update_execution(). Queued updates
+        to one execution are coalesced (latest value wins, node_results dicts
+        are merged). Pass flush=True for the terminal update: it waits for
+        everything queued so far, then writes synchronously so the final row
+        is visible when this returns.
+
+        If an earlier queued update for this execution failed, its error is
+        raised here (as RuntimeError) instead of applying the new update.
+        """
+        if flush:
+            await self._wait_for_writes()
+            self._raise_write_error(execution_id)
+            await self.update_execution(execution_id, **fields)
+            return
+
+        self._raise_write_error(execution_id)
+
+        values = self._execution_values(**fields)
+        if not values:
+            return
+
+        self._ensure_writer()
+        await self._write_q.put((execution_id, values))
+
+    def _ensure_writer(self) -> asyncio.Task:
+        """Return the running writer task, restarting it if it stopped or
+        belongs to another event loop."""
+        loop = asyncio.get_running_loop()
+        task = self._writer_task
+        if task is not None and not task.done() and self._writer_loop is loop:
+            return task
+
+        queue = self._write_q
+        if queue is None or self._writer_loop is not loop:
+            # Queues are bound to the loop that first waits on them; move any
+            # updates left by a previous loop's writer onto a fresh one
+            self._write_q = asyncio.Queue(maxsize=_WRITE_QUEUE_SIZE)
+            while queue is not None and not queue.empty():
+                self._write_q.put_nowait(queue.get_nowait())
+
+        self._writer_loop = loop
+        self._writer_task = loop.create_task(self._drain_writes(self._write_q))
+        return self._writer_task
+
+    async def _wait_for_writes(self, timeout: float = _FLUSH_TIMEOUT) -> None:
+        """
+        Wait until every queued update has been applied.
+
+        Raises RuntimeError if the writer stops first, or asyncio.TimeoutError
+        if the queue has not drained within `timeout` seconds.
+        """
+        if self._write_q is None:
+            return
+
+        writer = self._ensure_writer()
+        joined = asyncio.ensure_future(self._write_q.join())
+        try:
+            await asyncio.wait(
+                {joined, writer}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            drained = joined.done()
+            joined.cancel()
+
+        if drained:
+            return
+        if writer.done():
+            cause = None if writer.cancelled() else writer.exception()
+            raise RuntimeError(
+                f"Execution writer stopped with {self._write_q.qsize()} update(s) pending"
+            ) from cause
+        raise asyncio.TimeoutError(
+            f"Queued execution updates were not written within {timeout:g}s"
+        )
+
+    def _raise_write_error(self, execution_id: str) -> None:
+        error = self._write_errors.pop(execution_id, None)
+        if error is not None:
+            raise RuntimeError(
+                f"Queued update for execution {execution_id} failed: {error}"
+            ) from error
+
+    async def _drain_writes(self, queue: asyncio.Queue):
+        """Background task: apply queued execution updates in batches."""
+        while True:
+            batch = [await queue.get()]
+            try:
+                while len(batch) < _WRITE_BATCH:
+                    batch.append(await asyncio.wait_for(queue.get(), _WRITE_LINGER))
+            except asyncio.TimeoutError:
+                pass
+
+            pending: Dict[str, Dict[str, Any]] = {}
+            for execution_id, values in batch:
+                merged = pending.setdefault(execution_id, {})
+                node_results = values.get("node_results")
+                if isinstance(node_results, dict) and isinstance(merged.get("node_results"), dict):
+                    values = {**values, "node_results": {**merged["node_results"], **node_results}}
+                merged.update(values)
+
+            try:
+                async with self.session() as session:
+                    for execution_id, values in pending.items():
+                        await session.execute(
+                            update(ExecutionModel)
+                            .where(ExecutionModel.id == execution_id)
+                            .values(**values)
+                            .execution_options(synchronize_session=False)
+                        )
+            except Exception as e:
+                logger.exception("Failed to write %d queued execution update(s)", len(batch))
+                for execution_id in pending:
+                    self._write_errors[execution_id] = e
+            finally:
+                for _ in batch:
+                    queue.task_done()
 
 
 # ---------------------------------------------------------
@@ -4,11 +4,18 @@ Aligned with Mini-N8N executor, routes, and workflow engine.
 """
 
 from sqlalchemy import (
-    Column, String, Text, Integer, DateTime, Enum, JSON, Float, ForeignKey
+    Column, String, Text, Integer, DateTime, Enum, JSON, Float, ForeignKey, Index, func
 )
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import inspect
+from sqlalchemy.orm import DeclarativeBase, deferred
+from sqlalchemy.types import TypeDecorator
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Dict, List, Optional
 import enum
+import json
+import zlib
 
 
 # ---------------------------------------------------------
@@ -18,6 +25,50 @@ class Base(DeclarativeBase):
     pass
 
 
+# ---------------------------------------------------------
+# Large JSON payload column type
+# ---------------------------------------------------------
+class CompactJSON(TypeDecorator):
+    """
+    JSON column for potentially large payloads.
+
+    - PostgreSQL: stored as JSONB (binary, parsed once, indexable).
+    - Other dialects (SQLite): JSON text, zlib-compressed into a BLOB once
+      the serialized size exceeds COMPRESS_THRESHOLD. Plain JSON text rows
+      written before this type existed are still read as-is.
+    """
+    impl = Text
+    cache_ok = True
+
+    COMPRESS_THRESHOLD = 64 * 1024
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+
+        serializer = getattr(dialect, "_json_serializer", None) or json.dumps
+        encoded = serializer(value)
+        if len(encoded) <= self.COMPRESS_THRESHOLD:
+            return encoded
+        if isinstance(encoded, str):
+            encoded = encoded.encode("utf-8")
+        return zlib.compress(encoded)
+
+    def process_result_value(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            value = zlib.decompress(value)
+        deserializer = getattr(dialect, "_json_deserializer", None) or json.loads
+        return deserializer(value)
+
+
 # ---------------------------------------------------------
 # Execution Status Enum
 # ---------------------------------------------------------
@@ -48,13 +99,17 @@ class WorkflowModel(Base):
     description = Column(Text, nullable=True)
 
     # Stores full workflow definition as JSON
-    data = Column(JSON, nullable=False)
+    data = Column(CompactJSON, nullable=False)
 
     version = Column(Integer, default=1)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow,
-                        onupdate=datetime.utcnow, nullable=False)
+    # Timestamps are assigned by the database clock. default= renders now()
+    # into each INSERT, since tables created before server_default was
+    # added have NOT NULL columns with no database default.
+    created_at = Column(DateTime(timezone=True), default=func.now(),
+                        server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now(),
+                        onupdate=func.now(), nullable=False, index=True)
 
     def __repr__(self):
         return f"<Workflow(id={self.id}, name={self.name})>"
@@ -74,6 +129,12 @@ class ExecutionModel(Base):
     """
     __tablename__ = "executions"
 
+    # list_executions filters by workflow and pages by newest first; the
+    # composite index also serves plain workflow_id lookups
+    __table_args__ = (
+        Index("ix_exec_wf_created", "workflow_id", "created_at"),
+    )
+
     id = Column(String(36), primary_key=True)
 
     workflow_id = Column(
@@ -85,11 +146,15 @@ class ExecutionModel(Base):
     status = Column(Enum(ExecutionStatus), default=ExecutionStatus.PENDING)
 
     input_data = Column(JSON, nullable=True)
-    output_data = Column(JSON, nullable=True)
+    # Large payloads are deferred (load group "blobs"): plain SELECTs skip
+    # them; use Database.get_execution_full() when they are needed
+    output_data = deferred(Column(CompactJSON, nullable=True), group="blobs")
     error = Column(Text, nullable=True)
 
-    # Per-node results (NodeResult converted to JSON-safe dict)
-    node_results = Column(JSON, nullable=True)
+    # Per-node results (NodeResult converted to JSON-safe dict). Deprecated for
+    # new writes: results go to execution_node_results (NodeResultModel) and
+    # are materialized into this attribute by Database.get_execution_full()
+    node_results = deferred(Column(CompactJSON, nullable=True), group="blobs")
 
     # Ordered list of node IDs
     execution_order = Column(JSON, nullable=True)
@@ -99,16 +164,107 @@ class ExecutionModel(Base):
 
     execution_time = Column(Float, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # default= as well as server_default: see WorkflowModel
+    created_at = Column(DateTime(timezone=True), default=func.now(),
+                        server_default=func.now(), nullable=False, index=True)
     updated_at = Column(
-        DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        DateTime(timezone=True),
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
 
+    def to_dict(self):
+        """JSON-safe dict of the row; deferred columns only if already loaded."""
+        unloaded = inspect(self).unloaded
+        data = {
+            "id": self.id,
+            "workflow_id": self.workflow_id,
+            "status": self.status.value if self.status else None,
+            "input_data": self.input_data,
+            "error": self.error,
+            "execution_order": self.execution_order,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "execution_time": self.execution_time,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+        for key in ("output_data", "node_results"):
+            if key not in unloaded:
+                data[key] = getattr(self, key)
+        return data
+
     def __repr__(self):
         return (
             f"<Execution(id={self.id}, workflow_id={self.workflow_id}, "
             f"status={self.status})>"
         )
+
+
+# ---------------------------------------------------------
+# Node Result Model
+# ---------------------------------------------------------
+class NodeResultModel(Base):
+    """
+    One row per finished node of an execution, so each node's result is
+    written once instead of re-serializing the whole node_results dict.
+    """
+    __tablename__ = "execution_node_results"
+
+    __table_args__ = (
+        Index("ix_nr_exec", "execution_id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    execution_id = Column(
+        String(36),
+        ForeignKey("executions.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    node_id = Column(String(255), nullable=False)
+    result = Column(CompactJSON, nullable=True)
+
+    finished_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<NodeResult(execution_id={self.execution_id}, node_id={self.node_id})>"
+
+
+# ---------------------------------------------------------
+# Lightweight list-view rows (column projections, no JSON blobs)
+# ---------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class WorkflowSummary:
+    id: str
+    name: str
+    updated_at: Optional[datetime]
+    version: Optional[int]
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionSummary:
+    id: str
+    workflow_id: str
+    status: Optional[ExecutionStatus]
+    created_at: Optional[datetime]
+    execution_time: Optional[float]
+
+
+# ---------------------------------------------------------
+# Bulk execution inserts
+# ---------------------------------------------------------
+async def bulk_insert_executions(session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert many executions in one round trip on an AsyncSession.
+
+    Rows are plain column dicts and must all have the same keys. Sent as
+    multi-row INSERTs, chunked by the engine's insertmanyvalues_page_size.
+    """
+    if not rows:
+        return
+
+    await session.execute(ExecutionModel.__table__.insert(), rows)
@@ -4,35 +4,17 @@ Provides safe conversion between Workflow <-> JSON <-> dict,
 including support for datetime, enums, and Pydantic v2 models.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Union, List
 from pathlib import Path
-import json
+import asyncio
 import hashlib
+from pydantic import TypeAdapter
 
 from core.workflow import Workflow
 
-
-# -------------------------------------------------------------
-# Custom JSON Encoder (datetime, enums, UUID, pydantic objects)
-# -------------------------------------------------------------
-class EnhancedJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        # Pydantic models → dict
-        if hasattr(obj, "model_dump"):
-            return obj.model_dump()
-
-        # Enum → value
-        if hasattr(obj, "value"):
-            return obj.value
-
-        # datetime → isoformat
-        try:
-            return obj.isoformat()
-        except Exception:
-            pass
-
-        # Fallback
-        return str(obj)
+# Validators built once at import and reused by every from_json* call
+_WORKFLOW_ADAPTER = TypeAdapter(Workflow)
+_WORKFLOW_LIST_ADAPTER = TypeAdapter(List[Workflow])
 
 
 # -------------------------------------------------------------
@@ -46,20 +28,28 @@ class WorkflowSerializer:
     # -----------------------------------------------------
     @staticmethod
     def to_json(workflow: Workflow, pretty: bool = True) -> str:
-        data = workflow.model_dump()
-
-        if pretty:
-            return json.dumps(data, indent=2, cls=EnhancedJSONEncoder)
+        return WorkflowSerializer.to_json_bytes(workflow, pretty=pretty).decode()
 
-        return json.dumps(data, cls=EnhancedJSONEncoder)
+    @staticmethod
+    def to_json_bytes(workflow: Workflow, pretty: bool = False) -> bytes:
+        """UTF-8 JSON bytes of a workflow (what to_json() decodes)."""
+        # Serialized straight from pydantic-core, no intermediate dict
+        return workflow.__pydantic_serializer__.to_json(
+            workflow, indent=2 if pretty else None, fallback=str
+        )
 
     # -----------------------------------------------------
     # Parsing JSON → Workflow object
     # -----------------------------------------------------
     @staticmethod
-    def from_json(json_str: str) -> Workflow:
-        data = json.loads(json_str)
-        return Workflow.model_validate(data)
+    def from_json(json_str: Union[str, bytes]) -> Workflow:
+        # Parses and validates in one pass (no intermediate dict)
+        return _WORKFLOW_ADAPTER.validate_json(json_str)
+
+    @staticmethod
+    def from_json_list(json_str: Union[str, bytes]) -> List[Workflow]:
+        """Parse a JSON array of workflows."""
+        return _WORKFLOW_LIST_ADAPTER.validate_json(json_str)
 
     # -----------------------------------------------------
     # Save Workflow to file
@@ -74,15 +64,33 @@ class WorkflowSerializer:
     # -----------------------------------------------------
     @staticmethod
     def from_file(filepath: str) -> Workflow:
-        json_str = Path(filepath).read_text(encoding="utf-8")
-        return WorkflowSerializer.from_json(json_str)
+        # Raw bytes go straight to the parser (no str decode round-trip)
+        return WorkflowSerializer.from_json(Path(filepath).read_bytes())
+
+    # -----------------------------------------------------
+    # Async file variants (disk I/O runs off the event loop)
+    # -----------------------------------------------------
+    @staticmethod
+    async def to_file_async(workflow: Workflow, filepath: str, pretty: bool = True) -> None:
+        data = WorkflowSerializer.to_json(workflow, pretty=pretty).encode("utf-8")
+        await asyncio.to_thread(Path(filepath).write_bytes, data)
+
+    @staticmethod
+    async def from_file_async(filepath: str) -> Workflow:
+        data = await asyncio.to_thread(Path(filepath).read_bytes)
+        return WorkflowSerializer.from_json(data)
 
     # -----------------------------------------------------
     # Convert Workflow → dict
     # -----------------------------------------------------
     @staticmethod
     def to_dict(workflow: Workflow) -> Dict[str, Any]:
-        return workflow.model_dump()
+        """JSON-ready dict (None fields omitted), e.g. for the DB JSON column."""
+        serializer = getattr(workflow, "__pydantic_serializer__", None)
+        if serializer is not None:
+            return serializer.to_python(workflow, mode="json", exclude_none=True, fallback=str)
+
+        return workflow.model_dump(exclude_none=True)
 
     # -----------------------------------------------------
     # Convert dict → Workflow
@@ -97,5 +105,5 @@ class WorkflowSerializer:
     @staticmethod
     def compute_checksum(workflow: Workflow) -> str:
         """Compute SHA256 checksum of workflow content."""
-        content = WorkflowSerializer.to_json(workflow, pretty=False)
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        content = WorkflowSerializer.to_json_bytes(workflow)
+        return hashlib.sha256(content).digest()[:8].hex()
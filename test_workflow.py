@@ -1,18 +1,55 @@
 """Test script to verify the workflow automation engine."""
 
 import asyncio
+import io
 import json
+import sys
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from core.workflow import Workflow, WorkflowNode, WorkflowConnection
 from executor.engine import WorkflowExecutor
 from nodes.registry_setup import register_all_nodes
 from storage.database import init_database
+from storage.serialization import WorkflowSerializer
+
+
+# Output is buffered and written once per test instead of per line
+_out = io.StringIO()
+
+
+def _pretty_json(data):
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(data, indent=2)
+
+
+def _log(*parts):
+    _out.write(" ".join(map(str, parts)) + "\n")
+
+
+def _flush():
+    sys.stdout.write(_out.getvalue())
+    sys.stdout.flush()
+    _out.seek(0)
+    _out.truncate()
+
+
+async def _run(test):
+    try:
+        return await test()
+    finally:
+        _flush()
 
 
 async def test_simple_workflow():
     """Test a simple workflow with user input and output."""
-    print("=" * 60)
-    print("TEST: Simple Input -> Output Workflow")
-    print("=" * 60)
+    _log("=" * 60)
+    _log("TEST: Simple Input -> Output Workflow")
+    _log("=" * 60)
     
     # Create workflow
     workflow = Workflow(
@@ -53,19 +90,19 @@ async def test_simple_workflow():
         input_data={"message": "Test message from input"}
     )
     
-    print(f"Success: {result.success}")
-    print(f"Output: {result.output}")
-    print(f"Execution time: {result.execution_time:.2f}s")
-    print()
+    _log(f"Success: {result.success}")
+    _log(f"Output: {result.output}")
+    _log(f"Execution time: {result.execution_time:.2f}s")
+    _log()
     
     return result.success
 
 
 async def test_conditional_workflow():
     """Test a workflow with conditional logic."""
-    print("=" * 60)
-    print("TEST: Conditional Logic Workflow")
-    print("=" * 60)
+    _log("=" * 60)
+    _log("TEST: Conditional Logic Workflow")
+    _log("=" * 60)
     
     workflow = Workflow(
         name="Conditional Test",
@@ -114,19 +151,19 @@ async def test_conditional_workflow():
         input_data={"number": "10"}
     )
     
-    print(f"Success: {result.success}")
-    print(f"Condition result: {result.output}")
-    print(f"Execution time: {result.execution_time:.2f}s")
-    print()
+    _log(f"Success: {result.success}")
+    _log(f"Condition result: {result.output}")
+    _log(f"Execution time: {result.execution_time:.2f}s")
+    _log()
     
     return result.success
 
 
 async def test_http_workflow():
     """Test a workflow with HTTP request."""
-    print("=" * 60)
-    print("TEST: HTTP Request Workflow")
-    print("=" * 60)
+    _log("=" * 60)
+    _log("TEST: HTTP Request Workflow")
+    _log("=" * 60)
     
     workflow = Workflow(
         name="HTTP Test",
@@ -160,19 +197,19 @@ async def test_http_workflow():
     executor = WorkflowExecutor()
     result = await executor.execute(workflow=workflow)
     
-    print(f"Success: {result.success}")
-    print(f"HTTP Response: {json.dumps(result.output, indent=2)}")
-    print(f"Execution time: {result.execution_time:.2f}s")
-    print()
+    _log(f"Success: {result.success}")
+    _log(f"HTTP Response: {_pretty_json(result.output)}")
+    _log(f"Execution time: {result.execution_time:.2f}s")
+    _log()
     
     return result.success
 
 
 async def test_caching():
     """Test workflow execution caching."""
-    print("=" * 60)
-    print("TEST: Execution Caching")
-    print("=" * 60)
+    _log("=" * 60)
+    _log("TEST: Execution Caching")
+    _log("=" * 60)
     
     workflow = Workflow(name="Cache Test")
     
@@ -209,93 +246,98 @@ async def test_caching():
     # Get cache stats
     stats = executor.cache.get_stats()
     
-    print(f"First execution: {time1:.2f}s")
-    print(f"Second execution (cached): {time2:.2f}s")
-    print(f"Cache stats: {stats}")
-    print(f"Speedup: {time1/time2:.1f}x faster" if time2 > 0 else "N/A")
-    print()
+    _log(f"First execution: {time1:.2f}s")
+    _log(f"Second execution (cached): {time2:.2f}s")
+    _log(f"Cache stats: {stats}")
+    _log(f"Speedup: {time1/time2:.1f}x faster" if time2 > 0 else "N/A")
+    _log()
     
     return result1.success and result2.success
 
 
 async def test_from_json():
     """Test loading and executing workflow from JSON file."""
-    print("=" * 60)
-    print("TEST: Load Workflow from JSON")
-    print("=" * 60)
+    _log("=" * 60)
+    _log("TEST: Load Workflow from JSON")
+    _log("=" * 60)
     
     try:
-        # Load example workflow
-        with open("examples/data_enrichment.json") as f:
-            data = json.load(f)
+        # Load example workflow (a file may also hold a list of workflows).
+        # The read runs in a worker thread so it does not block the event loop
+        raw = await asyncio.to_thread(Path("examples/data_enrichment.json").read_bytes)
         
-        workflow = Workflow.from_dict(data)
+        if raw.lstrip().startswith(b"["):
+            workflow = WorkflowSerializer.from_json_list(raw)[0]
+        else:
+            workflow = WorkflowSerializer.from_json(raw)
         
-        print(f"Loaded workflow: {workflow.name}")
-        print(f"Nodes: {len(workflow.nodes)}")
-        print(f"Connections: {len(workflow.connections)}")
+        _log(f"Loaded workflow: {workflow.name}")
+        _log(f"Nodes: {len(workflow.nodes)}")
+        _log(f"Connections: {len(workflow.connections)}")
         
         # Execute
         executor = WorkflowExecutor()
         result = await executor.execute(workflow=workflow)
         
-        print(f"Success: {result.success}")
+        _log(f"Success: {result.success}")
         if result.error:
-            print(f"Error: {result.error}")
+            _log(f"Error: {result.error}")
         else:
-            print(f"Output nodes: {list(result.output.keys())}")
-        print()
+            _log(f"Output nodes: {list(result.output.keys())}")
+        _log()
         
         return result.success
     
     except FileNotFoundError:
-        print("Example file not found, skipping test")
+        _log("Example file not found, skipping test")
         return True
 
 
 async def main():
     """Run all tests."""
-    print("\n" + "=" * 60)
-    print("MINI-N8N WORKFLOW AUTOMATION ENGINE - TEST SUITE")
-    print("=" * 60 + "\n")
+    _log("\n" + "=" * 60)
+    _log("MINI-N8N WORKFLOW AUTOMATION ENGINE - TEST SUITE")
+    _log("=" * 60 + "\n")
     
     # Initialize
-    print("Initializing database...")
+    _log("Initializing database...")
     await init_database()
     
-    print("Registering nodes...")
+    _log("Registering nodes...")
     register_all_nodes()
-    print()
+    _log()
+    _flush()
     
     # Run tests
     results = []
     
-    results.append(("Simple Workflow", await test_simple_workflow()))
-    results.append(("Conditional Logic", await test_conditional_workflow()))
-    results.append(("HTTP Request", await test_http_workflow()))
-    results.append(("Caching", await test_caching()))
-    results.append(("JSON Loading", await test_from_json()))
+    results.append(("Simple Workflow", await _run(test_simple_workflow)))
+    results.append(("Conditional Logic", await _run(test_conditional_workflow)))
+    results.append(("HTTP Request", await _run(test_http_workflow)))
+    results.append(("Caching", await _run(test_caching)))
+    results.append(("JSON Loading", await _run(test_from_json)))
     
     # Summary
-    print("=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
+    _log("=" * 60)
+    _log("TEST SUMMARY")
+    _log("=" * 60)
     
     passed = sum(1 for _, result in results if result)
     total = len(results)
     
     for name, result in results:
         status = "✓ PASSED" if result else "✗ FAILED"
-        print(f"{status}: {name}")
+        _log(f"{status}: {name}")
     
-    print()
-    print(f"Total: {passed}/{total} tests passed")
-    print("=" * 60 + "\n")
+    _log()
+    _log(f"Total: {passed}/{total} tests passed")
+    _log("=" * 60 + "\n")
     
     if passed == total:
-        print("🎉 All tests passed!")
+        _log("🎉 All tests passed!")
     else:
-        print("⚠️  Some tests failed")
+        _log("⚠️  Some tests failed")
+    _flush()
     
     return passed == total
 
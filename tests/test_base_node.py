@@ -0,0 +1,78 @@
+"""
+Tests for BaseNode.execute() result handling and streamed results.
+"""
+
+import asyncio
+
+from nodes.base import BaseNode, NodeResult, collect_stream
+
+
+class _TestNode(BaseNode):
+    @classmethod
+    def get_input_schema(cls):
+        return {}
+
+    @classmethod
+    def get_output_schema(cls):
+        return {}
+
+    @classmethod
+    def get_config_schema(cls):
+        return {}
+
+
+class _PlainNode(_TestNode):
+    async def run(self, inputs, context):
+        return {"value": 1}
+
+
+class _ResultNode(_TestNode):
+    async def run(self, inputs, context):
+        return self.create_result({"value": 2}, success=False, error="bad", source="test")
+
+
+class _StreamNode(_TestNode):
+    def __init__(self, node_id, config):
+        super().__init__(node_id, config)
+        self.started = False
+
+    async def _chunks(self, output):
+        self.started = True
+        for part in ("a", "b"):
+            yield part
+        output["text"] = "ab"
+
+    async def run(self, inputs, context):
+        output = {"text": None}
+        return self.create_result(output, stream=self._chunks(output))
+
+
+def test_plain_output_is_wrapped():
+    result = asyncio.run(_PlainNode("plain", {}).execute({}, {}))
+    assert result.success
+    assert result.output == {"value": 1}
+    assert result.metadata["node_id"] == "plain"
+
+
+def test_create_result_is_passed_through():
+    result = asyncio.run(_ResultNode("res", {}).execute({}, {}))
+    assert isinstance(result.output, dict)
+    assert not result.success and result.error == "bad"
+    assert result.metadata["source"] == "test"
+    assert result.metadata["node_type"] == "_ResultNode"
+
+
+def test_stream_starts_only_when_iterated():
+    node = _StreamNode("stream", {})
+
+    async def scenario():
+        result = await node.execute({}, {})
+        assert not node.started
+        assert result.output["text"] is None
+        return await collect_stream(result)
+
+    result = asyncio.run(scenario())
+    assert node.started
+    assert result.stream is None
+    assert result.output["text"] == "ab"
+    assert isinstance(result, NodeResult)
@@ -0,0 +1,48 @@
+"""
+Tests for ConditionalLogicNode array (batch) comparisons.
+"""
+
+import asyncio
+
+import pytest
+
+from nodes.conditional_node import ConditionalLogicNode
+
+
+def _run(condition_type, value1, value2):
+    node = ConditionalLogicNode("cond", {
+        "conditions": [{
+            "value1": value1,
+            "value2": value2,
+            "condition_type": condition_type,
+        }],
+    })
+    result = asyncio.run(node.run({}, {}))
+    assert result.success
+    return result.output
+
+
+@pytest.mark.parametrize("condition_type, expected", [
+    ("equals", False),
+    ("not_equals", True),
+])
+def test_arrays_differing_in_one_element(condition_type, expected):
+    output = _run(condition_type, "[2, 4, 6]", "[2, 4, 7]")
+    assert output["result"] is expected
+    assert output["branch"] == ("true" if expected else "false")
+
+
+@pytest.mark.parametrize("condition_type, expected", [
+    ("equals", True),
+    ("not_equals", False),
+])
+def test_identical_arrays(condition_type, expected):
+    output = _run(condition_type, "[2, 4, 6]", "[2, 4, 6]")
+    assert output["result"] is expected
+
+
+def test_batch_reports_indices():
+    output = _run("not_equals", "[2, 4, 6]", "[2, 4, 7]")
+    evaluated = output["evaluated"][0]
+    assert evaluated["true_indices"] == [2]
+    assert evaluated["false_indices"] == [0, 1]
@@ -0,0 +1,89 @@
+"""
+Tests for Database bulk inserts.
+"""
+
+import asyncio
+import sqlite3
+
+from storage.database import Database
+from storage.models import ExecutionStatus
+
+
+def test_insert_executions_on_sqlite(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'test.db'}")
+    rows = [
+        {"id": f"ex-{i}", "workflow_id": "wf", "input_data": {"n": i}}
+        for i in range(250)
+    ]
+
+    async def scenario():
+        await db.init_db()
+        await db.create_workflow({"id": "wf", "name": "Test"})
+        await db.insert_executions(rows)
+        await db.insert_executions([])
+        items = await db.list_executions_lite("wf", limit=1000)
+        sample = await db.get_execution("ex-7")
+        await db.close()
+        return items, sample
+
+    items, sample = asyncio.run(scenario())
+    assert len(items) == 250
+    assert {item.status for item in items} == {ExecutionStatus.PENDING}
+    assert sample.input_data == {"n": 7}
+
+
+def test_get_execution_full_reads_node_result_rows(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'test.db'}")
+
+    async def scenario():
+        await db.init_db()
+        await db.create_workflow({"id": "wf", "name": "Test"})
+        await db.create_execution("ex", "wf")
+        await db.append_node_results("ex", {"first": {"output": 1}, "second": {"output": 2}})
+        execution = await db.get_execution_full("ex")
+        await db.close()
+        return execution
+
+    execution = asyncio.run(scenario())
+    assert list(execution.node_results) == ["first", "second"]
+    assert execution.node_results["second"] == {"output": 2}
+
+
+def test_legacy_schema_without_server_defaults(tmp_path):
+    """Tables created by the original models have no DB-side timestamp defaults."""
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE workflows (
+            id VARCHAR(36) PRIMARY KEY, name VARCHAR(255) NOT NULL, description TEXT,
+            data JSON NOT NULL, version INTEGER,
+            created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL
+        );
+        CREATE TABLE executions (
+            id VARCHAR(36) PRIMARY KEY,
+            workflow_id VARCHAR(36) NOT NULL REFERENCES workflows (id) ON DELETE CASCADE,
+            status VARCHAR(7), input_data JSON, output_data JSON, error TEXT,
+            node_results JSON, execution_order JSON, started_at DATETIME,
+            finished_at DATETIME, execution_time FLOAT,
+            created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL
+        );
+    """)
+    conn.close()
+
+    db = Database(f"sqlite:///{path}")
+
+    async def scenario():
+        await db.init_db()
+        workflow = await db.create_workflow({"id": "wf", "name": "Legacy"})
+        await db.create_execution("ex", "wf")
+        await db.insert_executions([{"id": "ex-2", "workflow_id": "wf"}])
+        updated = await db.update_workflow("wf", {"id": "wf", "name": "Renamed"})
+        items = await db.list_executions_lite("wf")
+        await db.close()
+        return workflow, updated, items
+
+    workflow, updated, items = asyncio.run(scenario())
+    assert workflow.created_at is not None and workflow.updated_at is not None
+    assert updated
+    assert {item.id for item in items} == {"ex", "ex-2"}
+    assert all(item.created_at is not None for item in items)
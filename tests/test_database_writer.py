@@ -0,0 +1,96 @@
+"""
+Tests for the background execution writer (Database.update_execution_async).
+"""
+
+import asyncio
+
+import pytest
+
+from storage.database import Database
+from storage.models import ExecutionStatus
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(f"sqlite:///{tmp_path / 'test.db'}")
+
+    async def setup():
+        await database.init_db()
+        await database.create_workflow({"id": "wf", "name": "Test"})
+        await database.create_execution("ex", "wf")
+        await database.engine.dispose()
+
+    asyncio.run(setup())
+    return database
+
+
+def test_flush_applies_queued_updates(db):
+    async def scenario():
+        await db.update_execution_async("ex", status=ExecutionStatus.RUNNING)
+        await db.update_execution_async("ex", node_results={"a": 1})
+        await db.update_execution_async("ex", node_results={"b": 2})
+        await db.update_execution_async(
+            "ex", flush=True, status=ExecutionStatus.SUCCESS, output_data={"ok": True}
+        )
+        execution = await db.get_execution_full("ex")
+        await db.close()
+        return execution
+
+    execution = asyncio.run(scenario())
+    assert execution.status == ExecutionStatus.SUCCESS
+    assert execution.output_data == {"ok": True}
+    assert execution.node_results == {"a": 1, "b": 2}
+
+
+def test_flush_restarts_a_stopped_writer(db):
+    async def scenario():
+        await db.update_execution_async("ex", status=ExecutionStatus.RUNNING)
+        db._writer_task.cancel()
+        await asyncio.gather(db._writer_task, return_exceptions=True)
+
+        await asyncio.wait_for(
+            db.update_execution_async("ex", flush=True, error="done"), timeout=5
+        )
+        execution = await db.get_execution("ex")
+        await db.close()
+        return execution
+
+    execution = asyncio.run(scenario())
+    assert execution.status == ExecutionStatus.RUNNING
+    assert execution.error == "done"
+
+
+def test_writer_follows_the_running_loop(db):
+    async def first():
+        await db.update_execution_async("ex", status=ExecutionStatus.RUNNING)
+        await db.update_execution_async("ex", flush=True, error="first")
+        await db.engine.dispose()
+
+    async def second():
+        await db.update_execution_async("ex", status=ExecutionStatus.SUCCESS)
+        await asyncio.wait_for(
+            db.update_execution_async("ex", flush=True, error="second"), timeout=5
+        )
+        execution = await db.get_execution("ex")
+        await db.close()
+        return execution
+
+    asyncio.run(first())
+    execution = asyncio.run(second())
+    assert execution.status == ExecutionStatus.SUCCESS
+    assert execution.error == "second"
+
+
+def test_failed_write_is_reported_on_flush(db):
+    async def scenario():
+        await db.update_execution_async("ex", output_data={"bad": object()})
+        with pytest.raises(RuntimeError, match="Queued update for execution ex failed"):
+            await db.update_execution_async("ex", flush=True, status=ExecutionStatus.SUCCESS)
+
+        # The error is reported once; the next terminal write goes through
+        await db.update_execution_async("ex", flush=True, status=ExecutionStatus.FAILED)
+        execution = await db.get_execution("ex")
+        await db.close()
+        return execution
+
+    assert asyncio.run(scenario()).status == ExecutionStatus.FAILED
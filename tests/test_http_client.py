@@ -0,0 +1,37 @@
+"""
+Tests for the shared HTTP client pools.
+"""
+
+import asyncio
+
+import httpx
+
+from utils.http_client import close_http_client, get_http_client, get_node_http_client
+
+
+def test_node_client_is_a_separate_pool():
+    async def scenario():
+        node_client = get_node_http_client()
+        assert node_client is get_node_http_client()
+        assert node_client is not get_http_client()
+        await close_http_client()
+        assert node_client.is_closed
+        assert get_node_http_client() is not node_client
+        await close_http_client()
+
+    asyncio.run(scenario())
+
+
+def test_node_client_does_not_store_response_cookies():
+    async def scenario():
+        client = get_node_http_client()
+        request = httpx.Request("GET", "https://example.com/login")
+        response = httpx.Response(
+            200, headers={"set-cookie": "session=secret; Path=/"}, request=request
+        )
+        client.cookies.extract_cookies(response)
+        stored = dict(client.cookies)
+        await close_http_client()
+        return stored
+
+    assert asyncio.run(scenario()) == {}
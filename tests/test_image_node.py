@@ -0,0 +1,29 @@
+"""
+Tests for ImageGenerationNode SDK clients.
+"""
+
+import asyncio
+
+from nodes import image_node
+from nodes.image_node import _get_openai_client
+from utils.http_client import close_http_client
+
+
+def test_openai_client_follows_the_shared_http_client(monkeypatch):
+    class FakeOpenAI:
+        def __init__(self, api_key, http_client):
+            self.api_key = api_key
+            self.http_client = http_client
+
+    monkeypatch.setattr(image_node, "AsyncOpenAI", FakeOpenAI)
+    image_node._build_openai_client.cache_clear()
+
+    first = _get_openai_client("key-a")
+    assert _get_openai_client("key-a") is first
+    assert _get_openai_client("key-b") is not first
+
+    asyncio.run(close_http_client())
+    second = _get_openai_client("key-a")
+    assert second is not first
+    assert not second.http_client.is_closed
+    image_node._build_openai_client.cache_clear()
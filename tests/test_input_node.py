@@ -0,0 +1,36 @@
+"""
+Tests for UserInputNode casting.
+"""
+
+import asyncio
+
+import pytest
+
+from nodes.input_node import UserInputNode
+
+
+def _run(value, expected_type="number"):
+    node = UserInputNode("input", {"type": expected_type})
+    return asyncio.run(node.run({}, {"value": value}))
+
+
+@pytest.mark.parametrize("value, expected", [
+    (True, 1),
+    (False, 0),
+    (3, 3),
+    (2.5, 2.5),
+    ("42", 42),
+    ("0.5", 0.5),
+    ([1, True, "2"], [1, 1, 2]),
+])
+def test_number_casting(value, expected):
+    result = _run(value)
+    assert result.success
+    assert result.output["value"] == expected
+    assert type(result.output["value"]) is type(expected)
+
+
+def test_invalid_number_fails():
+    result = _run("abc")
+    assert not result.success
+    assert "Expected number" in result.error
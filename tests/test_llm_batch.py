@@ -0,0 +1,39 @@
+"""
+Tests for LLMBatchCoordinator request collection.
+"""
+
+import asyncio
+
+from nodes.llm_batch import LLMBatchCoordinator
+
+
+class _EchoCoordinator(LLMBatchCoordinator):
+    """Answers each batch locally instead of calling a provider."""
+
+    def __init__(self):
+        super().__init__("openai", "test-model", client=None, flush_interval=0.01)
+        self.batch_sizes = []
+
+    async def _run_openai_batch(self, batch):
+        self.batch_sizes.append(len(batch))
+        return {request.custom_id: (request.prompt.upper(), 1) for request in batch}
+
+
+def test_concurrent_requests_share_a_batch():
+    coordinator = _EchoCoordinator()
+
+    async def scenario():
+        return await asyncio.gather(*(coordinator.submit(p, 0.0, 10) for p in "abc"))
+
+    assert asyncio.run(scenario()) == [("A", 1), ("B", 1), ("C", 1)]
+    assert coordinator.batch_sizes == [3]
+
+
+def test_coordinator_works_across_event_loops():
+    coordinator = _EchoCoordinator()
+
+    async def submit(prompt):
+        return await asyncio.wait_for(coordinator.submit(prompt, 0.0, 10), timeout=5)
+
+    assert asyncio.run(submit("first")) == ("FIRST", 1)
+    assert asyncio.run(submit("second")) == ("SECOND", 1)
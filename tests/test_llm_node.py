@@ -0,0 +1,50 @@
+"""
+Tests for LLMTextGenerationNode helpers: prompt rendering and SDK clients.
+"""
+
+import asyncio
+
+import pytest
+
+from nodes import llm_node
+from nodes.llm_node import _get_client, _render_prompt
+from utils.http_client import close_http_client
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("true", "Answer: true"),
+    ("null", "Answer: null"),
+    ('"Bob"', 'Answer: "Bob"'),
+    ("1e3", "Answer: 1e3"),
+])
+def test_suffix_is_not_json_probed(value, expected):
+    prefix, suffix = _render_prompt("Answer: {{x}}", {"x": value}, {})
+    assert prefix == "Answer: "
+    assert prefix + suffix == expected
+
+
+def test_static_template_has_no_suffix():
+    assert _render_prompt("Summarize the text.", {}, {}) == ("Summarize the text.", "")
+
+
+def test_template_starting_with_tag_has_no_prefix():
+    prefix, suffix = _render_prompt("{{topic}} in one line", {"topic": "Rust"}, {})
+    assert prefix == ""
+    assert suffix == "Rust in one line"
+
+
+def test_sdk_client_follows_the_shared_http_client(monkeypatch):
+    class FakeOpenAI:
+        def __init__(self, api_key, http_client, max_retries):
+            self.http_client = http_client
+
+    monkeypatch.setattr(llm_node, "AsyncOpenAI", FakeOpenAI)
+    llm_node._build_client.cache_clear()
+
+    first = _get_client("openai")
+    assert _get_client("openai") is first
+
+    asyncio.run(close_http_client())
+    second = _get_client("openai")
+    assert second is not first
+    assert not second.http_client.is_closed
@@ -0,0 +1,25 @@
+"""
+Tests for OutputNode formatting.
+"""
+
+import asyncio
+import json
+
+from nodes.output_node import OutputNode
+
+
+def _run(config, inputs):
+    node = OutputNode("o", config)
+    return asyncio.run(node.run(inputs, {}))
+
+
+def test_json_format_accepts_non_string_keys():
+    result = _run({"format": "json"}, {1: "a"})
+    assert result.success
+    assert json.loads(result.output["output"]) == {"1": "a"}
+
+
+def test_json_format_falls_back_to_str():
+    result = _run({"format": "json"}, {"when": object})
+    assert result.success
+    assert json.loads(result.output["output"]) == {"when": str(object)}
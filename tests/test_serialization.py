@@ -0,0 +1,41 @@
+"""
+Tests for WorkflowSerializer.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from storage.serialization import WorkflowSerializer
+
+EXAMPLES = sorted((Path(__file__).resolve().parent.parent / "examples").glob("*.json"))
+
+
+@pytest.mark.parametrize("path", EXAMPLES, ids=lambda p: p.stem)
+def test_json_round_trip(path):
+    workflow = WorkflowSerializer.from_file(str(path))
+
+    data = WorkflowSerializer.to_json_bytes(workflow)
+    assert json.loads(data) == workflow.model_dump(mode="json")
+    assert WorkflowSerializer.from_json(data) == workflow
+
+
+def test_pretty_output_is_indented():
+    workflow = WorkflowSerializer.from_file(str(EXAMPLES[0]))
+    assert WorkflowSerializer.to_json(workflow, pretty=True).startswith('{\n  "')
+    assert WorkflowSerializer.compute_checksum(workflow) == WorkflowSerializer.compute_checksum(
+        WorkflowSerializer.from_json(WorkflowSerializer.to_json(workflow))
+    )
+
+
+def test_async_file_round_trip(tmp_path):
+    workflow = WorkflowSerializer.from_file(str(EXAMPLES[0]))
+    target = str(tmp_path / "workflow.json")
+
+    async def scenario():
+        await WorkflowSerializer.to_file_async(workflow, target)
+        return await WorkflowSerializer.from_file_async(target)
+
+    assert asyncio.run(scenario()) == workflow
@@ -0,0 +1,33 @@
+"""
+Tests for template compilation and warming.
+"""
+
+from collections import OrderedDict
+from types import SimpleNamespace
+
+from nodes.conditional_node import ConditionalLogicNode
+from utils.template import compile_template, get_nested_value, interpolate_variables
+
+
+def test_node_construction_warms_config_templates():
+    template = "{{ warm_probe.output }} > {{ warm_probe.limit }}"
+    compile_template.cache_clear()
+
+    ConditionalLogicNode("cond", {"conditions": [{"value1": template, "value2": "1"}]})
+
+    hits = compile_template.cache_info().hits
+    interpolate_variables(template, {"warm_probe": {"output": 3, "limit": 2}})
+    assert compile_template.cache_info().hits == hits + 1
+
+
+def test_simple_and_jinja_templates_render_alike():
+    context = {"user": {"name": "Ada", "tags": ["a", "b"]}}
+    assert interpolate_variables("Hi {{ user.name }}", context) == "Hi Ada"
+    assert interpolate_variables("{{ user.tags | join(',') }}", context) == "a,b"
+
+
+def test_get_nested_value():
+    data = {"a": OrderedDict(b=SimpleNamespace(c=0)), "n": None}
+    assert get_nested_value(data, "a.b.c") == 0
+    assert get_nested_value(data, "a.x.c", "d") == "d"
+    assert get_nested_value(data, "n.c", "d") == "d"
@@ -0,0 +1,55 @@
+"""
+Tests for the VideoGenerationNode result cache.
+"""
+
+import asyncio
+
+import pytest
+
+from nodes import video_node
+from nodes.video_node import VideoGenerationNode
+
+
+@pytest.fixture
+def fake_replicate(monkeypatch):
+    calls = []
+
+    async def generate(self, prompt, model, duration, fps, reuse_prior=False):
+        calls.append(prompt)
+        return {"url": f"https://video.example/{len(calls)}.mp4"}
+
+    monkeypatch.setattr(VideoGenerationNode, "_generate_replicate", generate)
+    monkeypatch.setattr(video_node, "_VIDEO_CACHE", video_node._VideoResultCache())
+    return calls
+
+
+def _run(prompt, context=None):
+    node = VideoGenerationNode("video", {
+        "provider": "replicate",
+        "model": "zeroscope",
+        "prompt": prompt,
+    })
+    return asyncio.run(node.run({}, context or {}))
+
+
+def test_cached_entry_holds_only_the_provider_result(fake_replicate):
+    first = _run("a cat surfing")
+    assert first.success and not first.metadata["cached"]
+
+    (entry,) = video_node._VIDEO_CACHE._entries.values()
+    assert entry[0] == {"url": "https://video.example/1.mp4"}
+
+
+def test_cache_hit_reports_the_current_request(fake_replicate):
+    _run("A cat  surfing")
+    second = _run("a cat surfing")
+
+    assert fake_replicate == ["A cat  surfing"]
+    assert second.metadata["cached"]
+    assert second.output["output"] == "https://video.example/1.mp4"
+    assert second.output["prompt_used"] == "a cat surfing"
+
+    # Mutating a returned output must not reach later hits
+    second.output["output"] = "changed"
+    third = _run("a cat surfing")
+    assert third.output["output"] == "https://video.example/1.mp4"
@@ -4,15 +4,23 @@ nested value extraction, and reference detection.
 """
 
 from .template import (
-    PromptTemplate,
     interpolate_variables,
+    compile_template,
     get_nested_value,
     extract_node_references,
+    prepare_template,
+    render_prepared,
+    split_static_prefix,
+    warm_templates,
 )
 
 __all__ = [
-    "PromptTemplate",
     "interpolate_variables",
+    "compile_template",
     "get_nested_value",
     "extract_node_references",
+    "prepare_template",
+    "render_prepared",
+    "split_static_prefix",
+    "warm_templates",
 ]
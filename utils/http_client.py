@@ -0,0 +1,64 @@
+"""
+Shared HTTP clients.
+
+Process-wide httpx.AsyncClients so outbound calls reuse pooled keep-alive
+connections instead of paying a new TCP/TLS handshake per request. Provider
+SDKs use get_http_client(); HTTP nodes get their own pool from
+get_node_http_client(), whose cookie jar never stores Set-Cookie responses
+so session state cannot leak from one workflow's requests into another's.
+"""
+
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Optional
+import httpx
+
+
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+_CLIENT: Optional[httpx.AsyncClient] = None
+_NODE_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+class _RejectAllCookies(DefaultCookiePolicy):
+    """Cookie policy that refuses every cookie set by a response."""
+
+    def set_ok(self, cookie, request):
+        return False
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient (created lazily)."""
+    global _CLIENT
+
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(http2=True, limits=HTTP_LIMITS)
+
+    return _CLIENT
+
+
+def get_node_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient for HTTP nodes (created lazily).
+
+    Separate from the provider pool and never persists cookies.
+    """
+    global _NODE_CLIENT
+
+    if _NODE_CLIENT is None or _NODE_CLIENT.is_closed:
+        _NODE_CLIENT = httpx.AsyncClient(
+            http2=True,
+            limits=HTTP_LIMITS,
+            cookies=CookieJar(policy=_RejectAllCookies()),
+        )
+
+    return _NODE_CLIENT
+
+
+async def close_http_client():
+    """Close the shared AsyncClients (application shutdown)."""
+    global _CLIENT, _NODE_CLIENT
+
+    for client in (_CLIENT, _NODE_CLIENT):
+        if client is not None and not client.is_closed:
+            await client.aclose()
+    _CLIENT = None
+    _NODE_CLIENT = None
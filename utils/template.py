@@ -17,14 +17,31 @@ Provides:
 ✔ get_nested_value for OutputNode + others
 """
 
+import functools
+import json
 import re
-from typing import Dict, Any, Optional
+from collections import ChainMap
+from typing import Dict, Any, Optional, Tuple, Callable, Mapping
 from jinja2 import Environment, TemplateSyntaxError
 
+try:
+    import orjson
+except ImportError:  # stdlib json for the type-preservation probe
+    orjson = None
+
 
 # =====================================================================
 # Utility: Safe nested access
 # =====================================================================
+_MISS = object()
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Memoized dotted-path split (the same paths recur across runs)."""
+    return tuple(path.split("."))
+
+
 def get_nested_value(data: Any, path: str, default: Any = None) -> Any:
     """
     Resolve nested dictionary or object paths:
@@ -35,23 +52,228 @@ def get_nested_value(data: Any, path: str, default: Any = None) -> Any:
     if data is None:
         return default
 
-    keys = path.split(".")
+    # Single-key fast path
+    if "." not in path:
+        if isinstance(data, dict):
+            value = data.get(path, default)
+        else:
+            value = getattr(data, path, default)
+        return default if value is None else value
+
     current = data
 
-    for key in keys:
+    # One lookup per level; stop at the first missing key
+    for key in _split_path(path):
         if isinstance(current, dict):
-            current = current.get(key, default)
-        elif hasattr(current, key):
-            current = getattr(current, key)
+            current = current.get(key, _MISS)
         else:
-            return default
+            current = getattr(current, key, _MISS)
 
-        if current is None:
+        if current is _MISS or current is None:
             return default
 
     return current
 
 
+# =====================================================================
+# Shared Jinja environment
+# =====================================================================
+_ENV = Environment()
+
+# Inject custom filter for nested resolution:
+# {{ node1 | get("output.value") }}
+_ENV.filters["get"] = lambda obj, path: get_nested_value(obj, path)
+
+# {{ name }} / {{ name.attr.attr }} — the only tags the fast renderer handles
+_SIMPLE_EXPR_RE = re.compile(
+    r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)\s*\}\}"
+)
+_FALLBACK_EXPR_RE = re.compile(r"\{\{\s*([a-zA-Z0-9_.-]+)\s*\}\}")
+# {{nodeId.output.key}} references (extract_node_references)
+_NODE_REF_RE = re.compile(r"\{\{\s*([a-zA-Z0-9_-]+)\.([a-zA-Z0-9_.-]+)\s*\}\}")
+
+# Names Jinja parses as literals/operators rather than variables
+_JINJA_RESERVED = frozenset({
+    "true", "false", "none", "True", "False", "None",
+    "and", "or", "not", "in", "is", "if", "else", "self",
+})
+
+_UNDEFINED = object()
+
+if orjson is not None:
+    def _json_loads(text: str) -> Any:
+        """
+        orjson.loads: fails fast on non-JSON input (and, unlike json, rejects
+        NaN/Infinity). Integers beyond 64 bits, which orjson turns into
+        floats, are re-parsed with json so they stay exact.
+        """
+        value = orjson.loads(text)
+        if type(value) is float and not any(c in text for c in ".eE"):
+            return json.loads(text)
+        return value
+else:
+    _json_loads = json.loads
+
+# First characters the JSON parser can accept (incl. whitespace; NaN and
+# Infinity only parse with the stdlib fallback)
+_JSON_FIRST_CHARS = frozenset('{["-0123456789tfn \t\n\r' if orjson else '{["-0123456789tfnNI \t\n\r')
+
+
+class _NeedsJinja(Exception):
+    """Raised by the fast renderer when only Jinja can reproduce the result."""
+
+
+def _build_vars(
+    context: Dict[str, Any],
+    node_outputs: Optional[Dict[str, Any]],
+    inputs: Optional[Dict[str, Any]],
+) -> Mapping[str, Any]:
+    """
+    Variable scope without copying: node outputs by id shadow "inputs",
+    which shadows the workflow context.
+    """
+    return ChainMap(node_outputs or {}, {"inputs": inputs or {}}, context)
+
+
+def _lookup(jinja_vars: Mapping[str, Any], path: Tuple[str, ...]) -> str:
+    """Resolve a dotted path the way Jinja's default getattr does."""
+    value = jinja_vars.get(path[0], _UNDEFINED)
+    if value is _UNDEFINED:
+        value = _ENV.globals.get(path[0], _UNDEFINED)
+
+    for attr in path[1:]:
+        if value is _UNDEFINED:
+            raise _NeedsJinja()  # attribute of undefined -> Jinja raises
+        try:
+            value = getattr(value, attr)
+        except AttributeError:
+            try:
+                value = value[attr]
+            except (TypeError, LookupError):
+                value = _UNDEFINED
+
+    return "" if value is _UNDEFINED else str(value)
+
+
+def _parse_simple(template_str: str):
+    """
+    Pre-split a template into (literal, path) segments when every tag is a
+    plain variable reference. Returns None if the template needs Jinja.
+    """
+    if "\r" in template_str or "{%" in template_str or "{#" in template_str:
+        return None
+
+    # Jinja drops a single trailing newline from the template source
+    if template_str.endswith("\n"):
+        template_str = template_str[:-1]
+
+    parts = _SIMPLE_EXPR_RE.split(template_str)
+    literals, names = parts[0::2], parts[1::2]
+
+    if any("{{" in literal for literal in literals):
+        return None
+
+    paths = tuple(tuple(name.split(".")) for name in names)
+    if any(path[0] in _JINJA_RESERVED for path in paths):
+        return None
+
+    return tuple(literals), paths
+
+
+def _maybe_json(rendered: str) -> Any:
+    # Only strings that can start a JSON document are worth parsing
+    if not rendered or rendered[0] not in _JSON_FIRST_CHARS:
+        return rendered
+
+    # Try json parsing to preserve type
+    try:
+        return _json_loads(rendered)
+    except Exception:
+        return rendered
+
+
+def _render_fallback(template_str: str, jinja_vars: Mapping[str, Any]) -> str:
+    """Manual {{ path }} replacement for templates Jinja cannot parse."""
+
+    def _replace(match):
+        key = match.group(1)
+
+        # Handle dotted paths
+        if "." in key:
+            root, path = key.split(".", 1)
+            value = get_nested_value(jinja_vars.get(root), path)
+        else:
+            value = jinja_vars.get(key)
+
+        return "" if value is None else str(value)  # safe fallback
+
+    return _FALLBACK_EXPR_RE.sub(_replace, template_str)
+
+
+@functools.lru_cache(maxsize=512)
+def compile_template(template_str: str) -> Callable[..., Any]:
+    """
+    Parse a template once and return render(context, node_outputs=None,
+    inputs=None) with the same result as interpolate_variables().
+
+    Templates made only of literal text and {{ name.attr }} tags are rendered
+    by joining precomputed segments; anything else uses a cached Jinja
+    template (or the manual fallback when Jinja cannot parse it).
+    """
+    simple = _parse_simple(template_str)
+
+    try:
+        jinja_template = None if simple else _ENV.from_string(template_str)
+    except TemplateSyntaxError:
+        def render(context, node_outputs=None, inputs=None):
+            return _render_fallback(template_str, _build_vars(context, node_outputs, inputs))
+        return render
+
+    def render_jinja(jinja_vars):
+        nonlocal jinja_template
+        if jinja_template is None:
+            jinja_template = _ENV.from_string(template_str)
+        return _maybe_json(jinja_template.render(jinja_vars))
+
+    if simple is None:
+        def render(context, node_outputs=None, inputs=None):
+            return render_jinja(_build_vars(context, node_outputs, inputs))
+        return render
+
+    literals, paths = simple
+    last = literals[-1]
+
+    def render(context, node_outputs=None, inputs=None):
+        jinja_vars = _build_vars(context, node_outputs, inputs)
+        try:
+            out = []
+            for literal, path in zip(literals, paths):
+                out.append(literal)
+                out.append(_lookup(jinja_vars, path))
+            out.append(last)
+        except _NeedsJinja:
+            return render_jinja(jinja_vars)
+        return _maybe_json("".join(out))
+
+    return render
+
+
+def warm_templates(value: Any) -> None:
+    """
+    Compile every template string in a (nested) config ahead of execution,
+    so the per-run interpolate_variables() calls hit the compile cache.
+    """
+    if isinstance(value, str):
+        if "{{" in value or "{%" in value or "{#" in value:
+            compile_template(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            warm_templates(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            warm_templates(item)
+
+
 # =====================================================================
 # Main interpolation engine
 # =====================================================================
@@ -68,6 +290,8 @@ def interpolate_variables(
     - node_outputs containing previous node results
     - supports deep dot-notation like {{node1.output.text}}
 
+    Parsing is cached per template string (see compile_template).
+
     Returns:
         Interpolated string (type preserved when possible)
     """
@@ -75,85 +299,81 @@ def interpolate_variables(
     if not isinstance(template_str, str):
         return template_str  # Do not modify non-strings
 
-    node_outputs = node_outputs or {}
-    inputs = inputs or {}
-
-    # ================================================================
-    # Build flat variable map for Jinja
-    # ================================================================
-    jinja_vars = {}
-
-    # workflow-level context variables
-    jinja_vars.update(context)
-
-    # inputs available to this node
-    jinja_vars["inputs"] = inputs
-
-    # node outputs accessible as {{ nodeId }}
-    # and nested attributes are resolved manually below
-    for nid, out in node_outputs.items():
-        jinja_vars[nid] = out
-
-    # Jinja environment
-    env = Environment()
+    # No template syntax: nothing to render, only the JSON type probe applies
+    if "{{" not in template_str and "{%" not in template_str and "{#" not in template_str:
+        if "\r" in template_str:
+            template_str = template_str.replace("\r\n", "\n").replace("\r", "\n")
+        # Jinja drops a single trailing newline from the template source
+        return _maybe_json(template_str.removesuffix("\n"))
 
-    # Inject custom filter for nested resolution:
-    # {{ node1 | get("output.value") }}
-    env.filters["get"] = lambda obj, path: get_nested_value(obj, path)
+    return compile_template(template_str)(context, node_outputs, inputs)
 
-    # ================================================================
-    # First attempt: process with Jinja2
-    # ================================================================
-    try:
-        template = env.from_string(template_str)
-        rendered = template.render(**jinja_vars)
 
-        # Try json parsing to preserve type
-        try:
-            import json
-            return json.loads(rendered)
-        except Exception:
-            return rendered
+# =====================================================================
+# Prompt prefix splitting (provider prompt caching)
+# =====================================================================
+def split_static_prefix(template_str: str) -> Tuple[str, str]:
+    """
+    Split a template into (static_prefix, dynamic_remainder).
 
-    except TemplateSyntaxError:
-        pass  # fallback below
+    The prefix is the literal text before the first template tag, so it is
+    identical on every render and can be marked cacheable by LLM providers.
+    The remainder still needs interpolation.
+    """
+    if not isinstance(template_str, str):
+        return "", template_str
 
-    # ================================================================
-    # Fallback manual replacement (robust)
-    # ================================================================
-    result = template_str
+    positions = [i for i in (template_str.find(t) for t in ("{{", "{%", "{#")) if i >= 0]
+    if not positions:
+        return template_str, ""
 
-    # Match {{ something.something }}
-    pattern = r"\{\{\s*([a-zA-Z0-9_.-]+)\s*\}\}"
+    cut = min(positions)
+    return template_str[:cut], template_str[cut:]
 
-    for match in re.findall(pattern, template_str):
-        value = None
 
-        # Handle dotted paths
-        if "." in match:
-            root, path = match.split(".", 1)
-            base = jinja_vars.get(root)
-            value = get_nested_value(base, path)
-        else:
-            value = jinja_vars.get(match)
+# =====================================================================
+# Partial evaluation (config-time template resolution)
+# =====================================================================
+def prepare_template(value: Any) -> Tuple[bool, Any]:
+    """
+    Resolve a config value once at node construction when possible.
 
-        if value is None:
-            value = ""  # safe fallback
+    Returns (True, resolved) for values without template syntax, which can be
+    reused as-is on every run, or (False, value) for templates that must be
+    interpolated against runtime data via render_prepared().
+    """
+    if isinstance(value, str) and ("{{" in value or "{%" in value):
+        return False, value
+    return True, interpolate_variables(value, {})
 
-        result = result.replace(f"{{{{{match}}}}}", str(value))
 
-    return result
+def render_prepared(
+    prepared: Tuple[bool, Any],
+    context: Dict[str, Any],
+    node_outputs: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """Render a value produced by prepare_template()."""
+    is_static, value = prepared
+    if is_static:
+        return value
+    return interpolate_variables(value, context, node_outputs)
 
 
 # =====================================================================
 # Extract node references (debugging + workflow inspector)
 # =====================================================================
+@functools.lru_cache(maxsize=2048)
+def _node_references(text: str) -> Tuple[Tuple[str, str], ...]:
+    return tuple(_NODE_REF_RE.findall(text))
+
+
 def extract_node_references(text: str):
     """
     Returns list of node references:
         {{nodeId.output}}
         {{nodeId.output.key}}
     Output: list of tuples: (nodeId, "output.key")
+
+    Scans are cached per template string; each call gets its own list.
     """
-    pattern = r"\{\{\s*([a-zA-Z0-9_-]+)\.([a-zA-Z0-9_.-]+)\s*\}\}"
-    return re.findall(pattern, text)
+    return list(_node_references(text))